@@ -7,6 +7,7 @@ from .models import (
 from iam.models import User
 from projects.models import Project
 from tasks.models import Task
+from main.eager_loading import EagerLoadingMixin
 
 
 class AIModelSerializer(serializers.ModelSerializer):
@@ -22,7 +23,7 @@ class AIModelSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class AIJobSerializer(serializers.ModelSerializer):
+class AIJobSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for AI processing jobs."""
     
     user_name = serializers.CharField(source='user.get_full_name', read_only=True)
@@ -43,7 +44,27 @@ class AIJobSerializer(serializers.ModelSerializer):
         ]
 
 
-class SmartTimesheetSuggestionSerializer(serializers.ModelSerializer):
+class AIJobListSerializer(AIJobSerializer):
+    """Serializer for AI job listings, without the job payloads."""
+    
+    # The JSON payloads can be large; only single-job responses render them
+    PAYLOAD_FIELDS = ('input_data', 'output_data', 'result_metadata')
+    
+    class Meta(AIJobSerializer.Meta):
+        fields = [
+            'id', 'job_type', 'user', 'user_name', 'workspace', 'model', 'model_name',
+            'priority', 'status', 'progress_percentage', 'error_message',
+            'confidence_score', 'created_at', 'started_at', 'completed_at',
+            'processing_time'
+        ]
+    
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join user and model, and leave the unrendered payloads unloaded."""
+        return super().setup_eager_loading(queryset).defer(*cls.PAYLOAD_FIELDS)
+
+
+class SmartTimesheetSuggestionSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for timesheet suggestions."""
     
     user_name = serializers.CharField(source='user.get_full_name', read_only=True)
@@ -93,7 +114,21 @@ class TimesheetSuggestionActionSerializer(serializers.Serializer):
         return data
 
 
-class TaskAssignmentRecommendationSerializer(serializers.ModelSerializer):
+class TaskAssignmentAlternativeSerializer(serializers.ModelSerializer):
+    """Serializer for alternative task assignments."""
+    
+    user_name = serializers.CharField(source='user.get_full_name', read_only=True)
+    
+    class Meta:
+        model = TaskAssignmentAlternative
+        fields = [
+            'id', 'user', 'user_name', 'confidence_score', 
+            'ranking', 'reasoning'
+        ]
+        read_only_fields = ['id', 'user_name']
+
+
+class TaskAssignmentRecommendationSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for task assignment recommendations."""
     
     task_title = serializers.CharField(source='task.title', read_only=True)
@@ -102,7 +137,9 @@ class TaskAssignmentRecommendationSerializer(serializers.ModelSerializer):
         source='recommended_assignee.get_full_name', 
         read_only=True
     )
-    alternatives = serializers.SerializerMethodField()
+    # Alternatives are ordered by ranking, so the field's .all() reuses the
+    # prefetch setup_eager_loading() derives for it
+    alternatives = TaskAssignmentAlternativeSerializer(many=True, read_only=True)
     
     class Meta:
         model = TaskAssignmentRecommendation
@@ -119,25 +156,6 @@ class TaskAssignmentRecommendationSerializer(serializers.ModelSerializer):
             'estimated_completion_time', 'predicted_quality_score', 'workload_impact',
             'alternatives', 'created_at', 'responded_at'
         ]
-    
-    def get_alternatives(self, obj):
-        """Get alternative recommendations."""
-        alternatives = obj.alternatives.all().order_by('ranking')
-        return TaskAssignmentAlternativeSerializer(alternatives, many=True).data
-
-
-class TaskAssignmentAlternativeSerializer(serializers.ModelSerializer):
-    """Serializer for alternative task assignments."""
-    
-    user_name = serializers.CharField(source='user.get_full_name', read_only=True)
-    
-    class Meta:
-        model = TaskAssignmentAlternative
-        fields = [
-            'id', 'user', 'user_name', 'confidence_score', 
-            'ranking', 'reasoning'
-        ]
-        read_only_fields = ['id', 'user_name']
 
 
 class TaskAssignmentActionSerializer(serializers.Serializer):
@@ -159,7 +177,7 @@ class TaskAssignmentActionSerializer(serializers.Serializer):
         return data
 
 
-class AIInsightSerializer(serializers.ModelSerializer):
+class AIInsightSerializer(EagerLoadingMixin, serializers.ModelSerializer):
     """Serializer for AI insights."""
     
     user_name = serializers.CharField(source='user.get_full_name', read_only=True)
@@ -3,6 +3,7 @@ from datetime import datetime, timedelta, time
 from decimal import Decimal
 from typing import List, Dict, Optional, Tuple
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.db.models import Q, Avg, Sum, Count
 from django.contrib.auth import get_user_model
 
@@ -22,8 +23,10 @@ logger = logging.getLogger(__name__)
 class SmartTimesheetService:
     """AI service for generating intelligent timesheet suggestions."""
     
-    def __init__(self):
-        self.model = self._get_active_model('timesheet_generation')
+    @cached_property
+    def model(self) -> Optional[AIModel]:
+        """Active timesheet generation model, looked up once on first use."""
+        return self._get_active_model('timesheet_generation')
     
     def _get_active_model(self, model_type: str) -> Optional[AIModel]:
         """Get active AI model for the given type."""
@@ -195,8 +198,10 @@ class SmartTimesheetService:
 class TaskAssignmentService:
     """AI service for intelligent task assignment recommendations."""
     
-    def __init__(self):
-        self.model = self._get_active_model('task_assignment')
+    @cached_property
+    def model(self) -> Optional[AIModel]:
+        """Active task assignment model, looked up once on first use."""
+        return self._get_active_model('task_assignment')
     
     def _get_active_model(self, model_type: str) -> Optional[AIModel]:
         """Get active AI model for the given type."""
@@ -214,13 +219,14 @@ class TaskAssignmentService:
         project = task.project
         workspace = project.workspace
         
-        # Get all project members who could be assigned
-        potential_assignees = User.objects.filter(
+        # Get all project members who could be assigned; evaluated once, as
+        # the emptiness check and the scoring loop both need the rows
+        potential_assignees = list(User.objects.filter(
             project_memberships__project=project,
             project_memberships__is_active=True
-        ).distinct()
+        ).distinct())
         
-        if not potential_assignees.exists():
+        if not potential_assignees:
             logger.warning(f"No potential assignees found for task {task.id}")
             return None
         
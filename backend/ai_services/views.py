@@ -13,10 +13,11 @@ from .serializers import (
     AIModelSerializer, AIJobSerializer, SmartTimesheetSuggestionSerializer,
     TimesheetSuggestionActionSerializer, TaskAssignmentRecommendationSerializer,
     TaskAssignmentActionSerializer, AIInsightSerializer, InsightAcknowledgeSerializer,
-    AIJobCreateSerializer
+    AIJobCreateSerializer, AIJobListSerializer
 )
 from .services import SmartTimesheetService, TaskAssignmentService, AIInsightService
 from tasks.models import Task
+from projects.models import ProjectMember
 from organizations.models import Workspace
 from time_entries.models import TimeEntry
 
@@ -41,6 +42,8 @@ class AIJobViewSet(viewsets.ModelViewSet):
         """Return appropriate serializer based on action."""
         if self.action == 'create':
             return AIJobCreateSerializer
+        if self.action == 'list':
+            return AIJobListSerializer
         return AIJobSerializer
     
     def get_queryset(self):
@@ -53,6 +56,10 @@ class AIJobViewSet(viewsets.ModelViewSet):
         if workspace_id:
             queryset = queryset.filter(workspace_id=workspace_id)
         
+        if self.action == 'list':
+            queryset = AIJobListSerializer.setup_eager_loading(queryset)
+        else:
+            queryset = AIJobSerializer.setup_eager_loading(queryset)
         return queryset.order_by('-created_at')
     
     @action(detail=True, methods=['post'])
@@ -67,7 +74,8 @@ class AIJobViewSet(viewsets.ModelViewSet):
             )
         
         job.status = 'cancelled'
-        job.save()
+        # Leave the input/output JSON columns untouched
+        job.save(update_fields=['status'])
         
         return Response({'message': 'Job cancelled successfully'})
 
@@ -96,6 +104,7 @@ class SmartTimesheetSuggestionViewSet(viewsets.ModelViewSet):
             except ValueError:
                 pass
         
+        queryset = SmartTimesheetSuggestionSerializer.setup_eager_loading(queryset)
         return queryset.order_by('-created_at')
     
     @action(detail=False, methods=['post'])
@@ -210,6 +219,7 @@ class TaskAssignmentRecommendationViewSet(viewsets.ModelViewSet):
         if workspace_id:
             queryset = queryset.filter(workspace_id=workspace_id)
         
+        queryset = TaskAssignmentRecommendationSerializer.setup_eager_loading(queryset)
         return queryset.order_by('-created_at')
     
     @action(detail=False, methods=['post'])
@@ -224,16 +234,20 @@ class TaskAssignmentRecommendationViewSet(viewsets.ModelViewSet):
             )
         
         try:
-            task = Task.objects.get(id=task_id)
+            # The recommendation service reads the project as well
+            task = Task.objects.select_related('project').get(id=task_id)
         except Task.DoesNotExist:
             return Response(
                 {'error': 'Task not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Check permissions
-        if not (task.project.manager == request.user or 
-                task.project.members.filter(user=request.user).exists()):
+        # Check permissions; the manager check compares IDs, so only
+        # non-managers cost a membership query
+        if not (task.project.manager_id == request.user.id or 
+                ProjectMember.objects.filter(
+                    project_id=task.project_id, user=request.user
+                ).exists()):
             return Response(
                 {'error': 'Permission denied'},
                 status=status.HTTP_403_FORBIDDEN
@@ -296,7 +310,7 @@ class TaskAssignmentRecommendationViewSet(viewsets.ModelViewSet):
                         status=status.HTTP_400_BAD_REQUEST
                     )
             
-            recommendation.save()
+            recommendation.save(update_fields=['manager_feedback', 'responded_at', 'status'])
             
             response_serializer = TaskAssignmentRecommendationSerializer(recommendation)
             return Response(response_serializer.data)
@@ -328,6 +342,7 @@ class AIInsightViewSet(viewsets.ModelViewSet):
         if insight_type:
             queryset = queryset.filter(insight_type=insight_type)
         
+        queryset = AIInsightSerializer.setup_eager_loading(queryset)
         return queryset.order_by('-created_at')
     
     @action(detail=False, methods=['post'])
@@ -367,7 +382,7 @@ class AIInsightViewSet(viewsets.ModelViewSet):
             insight.is_acknowledged = True
             insight.acknowledged_by = request.user
             insight.acknowledged_at = timezone.now()
-            insight.save()
+            insight.save(update_fields=['is_acknowledged', 'acknowledged_by', 'acknowledged_at'])
             
             response_serializer = AIInsightSerializer(insight)
             return Response(response_serializer.data)
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chat", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="chatmessage",
+            name="chat_messag_parent__f12578_idx",
+        ),
+    ]
@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import connection, models
+from django.db.models import Count, Prefetch, Q
+from django.db.models.expressions import RawSQL
 from django.utils import timezone
 from django.core.validators import MaxLengthValidator
 import uuid
@@ -69,6 +71,37 @@ class ChatRoom(models.Model):
         return f"{self.get_room_type_display()}: {self.name}"
 
 
+class ChatMessageQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for rendering message threads.
+    """
+    
+    def with_details(self):
+        """
+        Load each message's author, reactions and mentions for serializing.
+        
+        The live reply count is annotated so serializers don't count per
+        message.
+        """
+        return self.select_related('user').annotate(
+            reply_total=Count('replies', filter=Q(replies__is_deleted=False))
+        ).prefetch_related(
+            Prefetch('reactions', queryset=ChatReaction.objects.select_related('user')),
+            Prefetch('mention_records', queryset=ChatMention.objects.select_related('user'))
+        )
+    
+    def with_thread(self):
+        """
+        Load each message together with its replies, reactions and mentions.
+        
+        Replies come through the reverse `replies` accessor in one prefetch
+        query however many messages are listed.
+        """
+        return self.with_details().prefetch_related(
+            Prefetch('replies', queryset=ChatMessage.objects.select_related('user'))
+        )
+
+
 class ChatMessage(models.Model):
     """
     Individual chat messages within rooms.
@@ -87,12 +120,14 @@ class ChatMessage(models.Model):
     room = models.ForeignKey(
         ChatRoom,
         on_delete=models.CASCADE,
-        related_name='messages'
+        related_name='messages',
+        db_index=False  # Covered by the (room, -created_at) index
     )
     user = models.ForeignKey(
         'iam.User',
         on_delete=models.CASCADE,
-        related_name='chat_messages'
+        related_name='chat_messages',
+        db_index=False  # Covered by the (user, -created_at) index
     )
     
     # Message content
@@ -134,28 +169,80 @@ class ChatMessage(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ChatMessageQuerySet.as_manager()
+    
     class Meta:
         db_table = 'chat_messages'
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['room', '-created_at']),
             models.Index(fields=['user', '-created_at']),
-            models.Index(fields=['parent_message']),
         ]
     
     def __str__(self):
         content_preview = self.content[:50] + '...' if len(self.content) > 50 else self.content
         return f"{self.user.email}: {content_preview}"
     
+    def load_thread(self, max_depth=5):
+        """
+        Load the live reply tree under this message in a single query.
+
+        A recursive CTE collects the reply ids down to `max_depth` levels.
+        Every loaded message gets a `thread_replies` list of its children in
+        posting order; replies nested deeper than `max_depth` stay unloaded.
+        Replies are loaded with_details(), so their reactions and mentions
+        cost one prefetch query each for the whole tree.
+        """
+        self.thread_replies = []
+        if max_depth < 1:
+            return self.thread_replies
+        
+        # Table and column names come from the model, so renames carry over
+        qn = connection.ops.quote_name
+        opts = ChatMessage._meta
+        table = qn(opts.db_table)
+        pk = qn(opts.pk.column)
+        parent = qn(opts.get_field('parent_message').column)
+        deleted = qn(opts.get_field('is_deleted').column)
+        thread_ids = RawSQL(
+            f'WITH RECURSIVE thread (id, depth) AS ('
+            f' SELECT {pk}, 1 FROM {table}'
+            f' WHERE {parent} = %s AND {deleted} = %s'
+            f' UNION ALL'
+            f' SELECT reply.{pk}, thread.depth + 1 FROM {table} reply'
+            f' JOIN thread ON reply.{parent} = thread.id'
+            f' WHERE reply.{deleted} = %s AND thread.depth < %s'
+            f') SELECT id FROM thread',
+            (self._meta.pk.get_db_prep_value(self.pk, connection), False, False, max_depth)
+        )
+        replies = list(
+            ChatMessage.objects.filter(pk__in=thread_ids)
+            .with_details().order_by('created_at')
+        )
+        
+        messages = {self.pk: self}
+        for reply in replies:
+            reply.thread_replies = []
+            messages[reply.pk] = reply
+        for reply in replies:
+            messages[reply.parent_message_id].thread_replies.append(reply)
+        
+        return self.thread_replies
+    
     def save(self, *args, **kwargs):
         """Update room's last message info when saving."""
         super().save(*args, **kwargs)
         
-        # Update room's last message tracking
+        # Update room's last message tracking with a direct UPDATE rather
+        # than cascading into ChatRoom.save()
         if not self.is_deleted:
-            self.room.last_message_at = self.created_at
-            self.room.last_message_by = self.user
-            self.room.save(update_fields=['last_message_at', 'last_message_by'])
+            ChatRoom.objects.filter(pk=self.room_id).update(
+                last_message_at=self.created_at,
+                last_message_by_id=self.user_id
+            )
+            if ChatMessage.room.is_cached(self):
+                self.room.last_message_at = self.created_at
+                self.room.last_message_by_id = self.user_id
 
 
 class ChatMention(models.Model):
@@ -288,12 +375,14 @@ class ChatNotification(models.Model):
     user = models.ForeignKey(
         'iam.User',
         on_delete=models.CASCADE,
-        related_name='chat_notifications'
+        related_name='chat_notifications',
+        db_index=False  # Covered by the (user, is_read, -created_at) index
     )
     room = models.ForeignKey(
         ChatRoom,
         on_delete=models.CASCADE,
-        related_name='notifications'
+        related_name='notifications',
+        db_index=False  # Covered by the (room, -created_at) index
     )
     message = models.ForeignKey(
         ChatMessage,
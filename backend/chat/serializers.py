@@ -73,20 +73,50 @@ class ChatMessageSerializer(serializers.ModelSerializer):
     
     def get_reply_count(self, obj):
         """Get number of replies to this message."""
-        return obj.replies.filter(is_deleted=False).count()
+        reply_total = getattr(obj, 'reply_total', None)
+        if reply_total is None:
+            return obj.replies.filter(is_deleted=False).count()
+        return reply_total
+    
+    @classmethod
+    def represent_thread(cls, replies, context=None):
+        """
+        Render a load_thread() reply tree as nested message dicts.
+
+        One serializer renders every reply and the tree is walked with an
+        explicit stack, so deep threads neither bind a serializer per reply
+        nor recurse. Each message's children are listed under `replies`.
+        """
+        serializer = cls(context=context or {})
+        thread = []
+        stack = [(replies, thread)]
+        while stack:
+            messages, output = stack.pop()
+            for message in messages:
+                data = serializer.to_representation(message)
+                data['replies'] = []
+                output.append(data)
+                stack.append((message.thread_replies, data['replies']))
+        return thread
+    
+    def validate_mention_user_ids(self, value):
+        """Validate all mentioned users exist with a single query."""
+        user_ids = list(dict.fromkeys(value))
+        found = set(User.objects.filter(id__in=user_ids).values_list('id', flat=True))
+        missing = [str(user_id) for user_id in user_ids if user_id not in found]
+        if missing:
+            raise serializers.ValidationError(f"Users not found: {', '.join(missing)}")
+        return user_ids
     
     def create(self, validated_data):
         """Create message with mentions."""
         mention_user_ids = validated_data.pop('mention_user_ids', [])
         message = super().create(validated_data)
         
-        # Create mentions
+        # Create mentions one by one so each mentioned user is notified
+        # by the post_save handler
         for user_id in mention_user_ids:
-            try:
-                user = User.objects.get(id=user_id)
-                ChatMention.objects.create(message=message, user=user)
-            except User.DoesNotExist:
-                continue
+            ChatMention.objects.create(message=message, user_id=user_id)
         
         return message
 
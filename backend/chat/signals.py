@@ -107,8 +107,8 @@ def handle_chat_reaction(sender, instance, created, **kwargs):
         async_to_sync(channel_layer.group_send)(room_group, reaction_data)
         
         # Notify message author if it's not their own reaction
-        if instance.user != instance.message.user:
-            user_group = f"user_{instance.message.user.id}"
+        if instance.user_id != instance.message.user_id:
+            user_group = f"user_{instance.message.user_id}"
             notification_data = {
                 'type': 'user_notification',
                 'notification_type': 'chat_reaction',
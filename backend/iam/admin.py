@@ -57,6 +57,8 @@ class UserRoleAdmin(admin.ModelAdmin):
     """Admin interface for UserRole model."""
     
     list_display = ('user', 'role', 'organization', 'granted_by', 'granted_at')
+    # granted_by is nullable, so the admin's automatic select_related() skips it
+    list_select_related = ('user', 'role', 'granted_by')
     list_filter = ('role', 'granted_at')
     search_fields = ('user__email', 'user__username', 'role__name')
     readonly_fields = ('granted_at',)
@@ -73,6 +75,7 @@ class SessionAdmin(admin.ModelAdmin):
     
     list_display = ('user', 'ip_address', 'location', 'is_active', 
                    'created_at', 'expires_at')
+    list_select_related = ('user',)
     list_filter = ('is_active', 'created_at', 'expires_at')
     search_fields = ('user__email', 'user__username', 'ip_address', 'location')
     readonly_fields = ('created_at', 'last_accessed')
@@ -90,6 +93,7 @@ class AuditLogAdmin(admin.ModelAdmin):
     
     list_display = ('user', 'action', 'resource_type', 'resource_id', 
                    'organization', 'timestamp')
+    list_select_related = ('user',)
     list_filter = ('action', 'resource_type', 'timestamp')
     search_fields = ('user__email', 'user__username', 'action', 'resource_type', 
                     'resource_id')
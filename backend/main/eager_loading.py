@@ -0,0 +1,108 @@
+from functools import lru_cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+def _relation_path(model, source):
+    """
+    Follow the relations named by a dotted `source` from `model`.
+
+    Returns the ORM lookup for the chain of relations the source crosses
+    and whether that chain passes through a to-many relation.
+    """
+    path = []
+    many = False
+    for attr in source.split('.'):
+        try:
+            field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        path.append(attr)
+        many = many or field.many_to_many or field.one_to_many
+        model = field.related_model
+    return '__'.join(path), many
+
+
+@lru_cache(maxsize=None)
+def related_lookups(serializer_class):
+    """
+    Work out the relations a model serializer reads, once per class.
+
+    Dotted sources and nested serializers over to-one relations become
+    select_related() paths; to-many relations become prefetch paths, paired
+    with the nested serializer class that renders them, if any. Primary key
+    fields only read the local `<name>_id` column, so they are skipped.
+    """
+    model = serializer_class.Meta.model
+    select = []
+    prefetch = []
+
+    for field in serializer_class().fields.values():
+        if field.write_only or field.source == '*':
+            continue
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            continue
+
+        path, many = _relation_path(model, field.source)
+        if not path:
+            continue
+
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        nested_class = (
+            type(nested) if isinstance(nested, serializers.ModelSerializer) else None
+        )
+
+        if many or isinstance(field, serializers.ListSerializer):
+            prefetch.append((path, nested_class))
+        else:
+            select.append(path)
+            if nested_class is not None:
+                nested_select, nested_prefetch = related_lookups(nested_class)
+                select += [f'{path}__{lookup}' for lookup in nested_select]
+                prefetch += [
+                    (f'{path}__{lookup}', lookup_class)
+                    for lookup, lookup_class in nested_prefetch
+                ]
+
+    return tuple(dict.fromkeys(select)), tuple(dict.fromkeys(prefetch))
+
+
+def eager_load(queryset, serializer_class):
+    """
+    Apply the joins and prefetches `serializer_class` needs to `queryset`.
+
+    Nested list serializers get a Prefetch whose queryset is eager loaded
+    for that serializer in turn.
+    """
+    select, prefetch = related_lookups(serializer_class)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        # Prefetch objects are built per call; Django rewrites their lookups
+        # when they are nested, so they can't be shared between querysets
+        queryset = queryset.prefetch_related(*[
+            Prefetch(
+                lookup,
+                queryset=eager_load(lookup_class.Meta.model._default_manager.all(), lookup_class)
+            ) if lookup_class is not None else lookup
+            for lookup, lookup_class in prefetch
+        ])
+    return queryset
+
+
+class EagerLoadingMixin:
+    """
+    Model serializer mixin deriving setup_eager_loading() from its fields.
+
+    Views call `Serializer.setup_eager_loading(queryset)` as before; the
+    select/prefetch lists follow the declared fields instead of being kept
+    in step by hand.
+    """
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Join and prefetch the relations this serializer reads."""
+        return eager_load(queryset, cls)
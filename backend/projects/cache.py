@@ -0,0 +1,108 @@
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+
+# Dashboard data is read-heavy and tolerates brief staleness
+DASHBOARD_CACHE_TTL = 45
+
+
+def dashboard_cache_key(user_id, workspace_id=None):
+    """Build the cache key for a user's project dashboard."""
+    return f"projects:dashboard:{user_id}:{str(workspace_id) if workspace_id else 'all'}"
+
+
+def invalidate_dashboards(user_ids, *workspace_ids):
+    """Drop cached dashboards for the given users in one or more workspaces."""
+    keys = []
+    for user_id in user_ids:
+        if user_id is None:
+            continue
+        keys += [
+            dashboard_cache_key(user_id, workspace_id)
+            for workspace_id in workspace_ids if workspace_id is not None
+        ]
+        keys.append(dashboard_cache_key(user_id))
+
+    if keys:
+        cache.delete_many(keys)
+
+
+# Project statistics are aggregate-heavy and refreshed in bursts
+STATS_CACHE_TTL = 30
+
+
+def stats_cache_key(project_id):
+    """Build the cache key for a project's statistics."""
+    return f"projects:stats:{project_id}:v1"
+
+
+# The priced total of a project's time entries; only time entries and the
+# project's own rate change it, and both invalidate it
+COST_CACHE_TTL = 300
+
+
+def cost_cache_key(project_id):
+    """Build the cache key for a project's total time cost."""
+    return f"projects:cost:{project_id}"
+
+
+def invalidate_project_stats(project_id):
+    """Drop cached statistics and cost for a project."""
+    if project_id is not None:
+        cache.delete_many([stats_cache_key(project_id), cost_cache_key(project_id)])
+
+
+# Task completion counts behind project progress
+PROGRESS_CACHE_TTL = 300
+# Small projects are cheap to count, so only memoize larger ones
+PROGRESS_CACHE_MIN_TASKS = 16
+
+
+def progress_cache_key(project_id):
+    """Build the cache key for a project's (total, completed) task counts."""
+    return f"project:{project_id}:progress"
+
+
+def invalidate_project_progress(project_id):
+    """Drop cached task counts for a project."""
+    if project_id is not None:
+        cache.delete(progress_cache_key(project_id))
+
+
+def refresh_project_progress(project_ids):
+    """
+    Recount task progress for many projects with one GROUP BY query.
+    
+    Large projects get fresh cached counts; the rest are dropped, matching
+    what the serializers would cache on their next read.
+    """
+    from tasks.models import Task
+    
+    project_ids = [project_id for project_id in project_ids if project_id is not None]
+    if not project_ids:
+        return
+    
+    rows = Task.objects.filter(project_id__in=project_ids).order_by().values(
+        'project_id'
+    ).annotate(
+        total=Count('id'),
+        completed=Count('id', filter=Q(status='done'))
+    )
+    
+    fresh = {
+        progress_cache_key(row['project_id']): {
+            'total': row['total'],
+            'completed': row['completed']
+        }
+        for row in rows
+        if row['total'] >= PROGRESS_CACHE_MIN_TASKS
+    }
+    stale = [
+        progress_cache_key(project_id) for project_id in project_ids
+        if progress_cache_key(project_id) not in fresh
+    ]
+    
+    if fresh:
+        cache.set_many(fresh, PROGRESS_CACHE_TTL)
+    if stale:
+        cache.delete_many(stale)
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from projects.models import Sprint
+
+
+class Command(BaseCommand):
+    """
+    Activate and complete sprints whose start or end date has been reached.
+    
+    Meant to run once a day from cron or a beat schedule.
+    """
+    help = 'Move sprints to active/completed based on their dates'
+    
+    def handle(self, *args, **options):
+        activated, completed = Sprint.objects.sync_statuses()
+        self.stdout.write(
+            self.style.SUCCESS(f"Activated {activated} and completed {completed} sprints")
+        )
@@ -0,0 +1,41 @@
+# Trigram indexes backing the project list `search` filter.
+
+from django.db import migrations
+
+
+TRIGRAM_INDEXES = [
+    ("projects_name_trgm_idx", "projects", "name"),
+    ("projects_description_trgm_idx", "projects", "description"),
+    ("clients_name_trgm_idx", "clients", "name"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create pg_trgm GIN indexes so `icontains` searches can use an index."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} "
+            f"ON {table} USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for index_name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
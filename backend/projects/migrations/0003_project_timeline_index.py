@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0002_project_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["workspace", "start_date", "end_date"],
+                name="projects_workspa_1c94d7_idx",
+            ),
+        ),
+    ]
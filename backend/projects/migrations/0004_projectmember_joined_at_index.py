@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0003_project_timeline_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="projectmember",
+            index=models.Index(
+                fields=["joined_at", "id"], name="project_mem_joined__c14ade_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:23
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_actual_minutes(apps, schema_editor):
+    """Seed the counter from the time entries tracked so far."""
+    Project = apps.get_model("projects", "Project")
+    TimeEntry = apps.get_model("time_entries", "TimeEntry")
+
+    minutes = (
+        TimeEntry.objects.filter(project=OuterRef("pk"))
+        .order_by()
+        .values("project")
+        .annotate(total=Sum("duration_minutes"))
+        .values("total")
+    )
+    Project.objects.update(actual_minutes=Coalesce(Subquery(minutes), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0004_projectmember_joined_at_index"),
+        ("time_entries", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="actual_minutes",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_actual_minutes, migrations.RunPython.noop),
+    ]
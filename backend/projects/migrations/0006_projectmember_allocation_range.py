@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0005_project_actual_minutes"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="projectmember",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("allocation_percent__gte", 1), ("allocation_percent__lte", 100)
+                ),
+                name="project_member_allocation_range",
+            ),
+        ),
+    ]
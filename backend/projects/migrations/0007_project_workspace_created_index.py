@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0006_projectmember_allocation_range"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["workspace", "-created_at"], name="projects_workspa_afc2a3_idx"
+            ),
+        ),
+    ]
@@ -1,10 +1,35 @@
 from django.db import models
+from django.db.models import (
+    Case, Count, DecimalField, F, FloatField, OuterRef, Q, Subquery, Sum, Value, When
+)
+from django.db.models.functions import Coalesce, Now, NullIf
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
 import uuid
 
 
+class ClientQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for client listings.
+    """
+    
+    def with_project_totals(self):
+        """
+        Annotate open project counts and total fixed-price value.
+        
+        Both come back in the list query itself, instead of a COUNT and a
+        SUM per client. The queryset must not already join a multi-valued
+        relation, or the totals would be multiplied.
+        """
+        return self.annotate(
+            projects_count=Count(
+                'projects', filter=Q(projects__status__in=['planning', 'active', 'on_hold'])
+            ),
+            total_project_value=Coalesce(Sum('projects__fixed_price'), Decimal('0.00'))
+        )
+
+
 class Client(models.Model):
     """
     Client/Customer for billable projects.
@@ -43,6 +68,8 @@ class Client(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ClientQuerySet.as_manager()
+    
     class Meta:
         db_table = 'clients'
         unique_together = ['organization', 'name']
@@ -51,6 +78,119 @@ class Client(models.Model):
         return self.name
 
 
+def project_total(queryset, aggregate):
+    """Correlated subquery totalling `queryset` per project, 0 when empty."""
+    subquery = queryset.order_by().values('project').annotate(
+        total=aggregate
+    ).values('total')
+    return Coalesce(Subquery(subquery), 0)
+
+
+def rated_minutes(default_rate):
+    """
+    Sum of time entry minutes weighted by their hourly rate.
+    
+    Entries without a rate of their own, or with a zero rate, bill at
+    `default_rate` (the project's rate).
+    """
+    return Sum(
+        F('duration_minutes') * Coalesce(
+            NullIf('hourly_rate', Value(0)),
+            Value(default_rate or Decimal('0.00'))
+        ),
+        output_field=DecimalField(max_digits=20, decimal_places=2)
+    )
+
+
+def project_progress(tasks):
+    """
+    Correlated subquery for the percentage of `tasks` completed per project.
+    
+    Both counts come from one grouped scan of the project's tasks, and a
+    project without tasks gets 0 rather than a division by zero.
+    """
+    subquery = tasks.order_by().values('project').annotate(
+        progress=Count('id', filter=Q(status='done')) * 100.0 / Count('id')
+    ).values('progress')
+    return Coalesce(Subquery(subquery), Value(0.0), output_field=FloatField())
+
+
+class ProjectQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for project listings.
+    """
+    
+    # Columns read by ProjectSummarySerializer
+    list_fields = [
+        'id', 'workspace', 'name', 'color', 'status', 'billing_type',
+        'start_date', 'end_date', 'actual_minutes', 'created_at', 'updated_at',
+        'client__id', 'client__name',
+        'manager__id', 'manager__first_name', 'manager__last_name'
+    ]
+    
+    def for_list(self):
+        """
+        Load only the columns list views render.
+        
+        Descriptions and billing settings stay in the database; reading a
+        deferred field on a listed project costs one query per row.
+        """
+        return self.select_related('client', 'manager').only(*self.list_fields)
+    
+    def with_stats(self):
+        """
+        Annotate task progress, team and billable-time totals in the project query.
+        
+        Each total is a correlated subquery, so the joins cannot fan out and
+        inflate one another's counts or sums.
+        """
+        from tasks.models import Task
+        from time_entries.models import TimeEntry
+        
+        tasks = Task.objects.filter(project=OuterRef('pk'))
+        members = ProjectMember.objects.filter(project=OuterRef('pk'))
+        time_entries = TimeEntry.objects.filter(
+            project=OuterRef('pk'),
+            duration_minutes__isnull=False
+        )
+        
+        return self.annotate(
+            tasks_progress=project_progress(tasks),
+            members_total=project_total(members, Count('id')),
+            billable_minutes=project_total(
+                time_entries.filter(is_billable=True), Sum('duration_minutes')
+            ),
+        )
+    
+    def recount_actual_minutes(self):
+        """Rebuild the actual_minutes counter from the projects' time entries."""
+        from time_entries.models import TimeEntry
+        
+        return self.update(actual_minutes=project_total(
+            TimeEntry.objects.filter(project=OuterRef('pk')),
+            Sum('duration_minutes')
+        ))
+    
+    def with_overdue(self):
+        """
+        Annotate is_overdue: past its end date and not completed.
+        
+        Evaluated by the database, so it can be filtered on and saves a date
+        comparison per serialized project.
+        """
+        return self.annotate(
+            is_overdue=Case(
+                When(
+                    ~Q(status='completed'),
+                    end_date__lt=timezone.now().date(),
+                    then=Value(True)
+                ),
+                default=Value(False),
+                output_field=models.BooleanField()
+            )
+        )
+
+
 class Project(models.Model):
     """
     Project container for tasks and time tracking.
@@ -130,16 +270,62 @@ class Project(models.Model):
     is_template = models.BooleanField(default=False)
     template_name = models.CharField(max_length=255, blank=True)
     
+    # Denormalized total of the project's time entries, kept in step by
+    # time_entries.signals
+    actual_minutes = models.PositiveIntegerField(default=0, editable=False)
+    
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ProjectQuerySet.as_manager()
+    
     class Meta:
         db_table = 'projects'
         unique_together = ['workspace', 'name']
+        indexes = [
+            models.Index(fields=['workspace', 'start_date', 'end_date']),
+            # Project lists are scoped to workspaces and newest first
+            models.Index(fields=['workspace', '-created_at']),
+        ]
+        
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded workspace and manager so a move or a handover
+        # can clear the dashboards that listed the project before
+        instance._loaded_workspace_id = instance.__dict__.get('workspace_id')
+        instance._loaded_manager_id = instance.__dict__.get('manager_id')
+        return instance
         
     def __str__(self):
         return f"{self.workspace.name} - {self.name}"
 
+    def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
+        """
+        Save the project without writing back its actual_minutes counter.
+
+        The counter is shifted in place by time entry signals, so the value
+        held by an already-loaded instance may be stale. It is only written
+        on insert or when named in `update_fields`.
+        """
+        if not self._state.adding and not force_insert and update_fields is None:
+            # Deferred fields stay deferred, as in Django's own partial save
+            deferred = self.get_deferred_fields()
+            update_fields = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name != 'actual_minutes'
+            ]
+        super().save(
+            force_insert=force_insert,
+            force_update=force_update,
+            using=using,
+            update_fields=update_fields
+        )
+        self._loaded_workspace_id = self.workspace_id
+        self._loaded_manager_id = self.manager_id
+
 
 class ProjectMember(models.Model):
     """
@@ -186,6 +372,17 @@ class ProjectMember(models.Model):
     class Meta:
         db_table = 'project_members'
         unique_together = ['project', 'user']
+        indexes = [
+            models.Index(fields=['joined_at', 'id']),
+        ]
+        constraints = [
+            # Validators only run in full_clean(); bulk_create() and update()
+            # paths rely on the database to reject out-of-range allocations
+            models.CheckConstraint(
+                check=Q(allocation_percent__gte=1) & Q(allocation_percent__lte=100),
+                name='project_member_allocation_range'
+            ),
+        ]
         
     def __str__(self):
         return f"{self.project.name} - {self.user.email} ({self.role})"
@@ -242,6 +439,34 @@ class Epic(models.Model):
         return f"{self.project.name} - {self.title}"
 
 
+class SprintQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for sprint scheduling.
+    """
+    
+    def sync_statuses(self, today=None):
+        """
+        Move sprints whose dates have been reached to their next status.
+        
+        Runs as two UPDATE statements, so a daily job can keep every sprint
+        current without saving rows one by one. Returns the number of
+        sprints activated and completed.
+        """
+        today = today or timezone.now().date()
+        
+        activated = self.filter(
+            status='planned',
+            start_date__lte=today,
+            end_date__gte=today
+        ).update(status='active', updated_at=Now())
+        completed = self.filter(
+            status='active',
+            end_date__lt=today
+        ).update(status='completed', updated_at=Now())
+        
+        return activated, completed
+
+
 class Sprint(models.Model):
     """
     Sprint/iteration for agile project management.
@@ -280,6 +505,8 @@ class Sprint(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = SprintQuerySet.as_manager()
+    
     class Meta:
         db_table = 'sprints'
         unique_together = ['project', 'name']
@@ -1,8 +1,15 @@
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.db import models
+from django.core.cache import cache
 from decimal import Decimal
-from .models import Client, Project, ProjectMember, Epic
+from .models import Client, Project, ProjectMember, Epic, rated_minutes
+from .cache import (
+    COST_CACHE_TTL, PROGRESS_CACHE_MIN_TASKS, PROGRESS_CACHE_TTL,
+    cost_cache_key, progress_cache_key
+)
 from iam.models import User
 
 
@@ -25,13 +32,18 @@ class ClientSerializer(serializers.ModelSerializer):
     
     def get_projects_count(self, obj):
         """Get number of projects for this client."""
-        return obj.projects.filter(status__in=['planning', 'active', 'on_hold']).count()
+        projects_count = getattr(obj, 'projects_count', None)
+        if projects_count is None:
+            return obj.projects.filter(status__in=['planning', 'active', 'on_hold']).count()
+        return projects_count
     
     def get_total_project_value(self, obj):
         """Get total value of all client projects."""
-        total = obj.projects.aggregate(
-            total=models.Sum('fixed_price')
-        )['total'] or Decimal('0.00')
+        total = getattr(obj, 'total_project_value', None)
+        if total is None:
+            total = obj.projects.aggregate(
+                total=models.Sum('fixed_price')
+            )['total'] or Decimal('0.00')
         return total
 
 
@@ -95,57 +107,80 @@ class ProjectSerializer(serializers.ModelSerializer):
     
     def get_total_hours(self, obj):
         """Calculate total hours tracked on this project."""
-        from time_entries.models import TimeEntry
-        total_minutes = TimeEntry.objects.filter(
-            project=obj,
-            duration_minutes__isnull=False
-        ).aggregate(total=models.Sum('duration_minutes'))['total'] or 0
-        return round(total_minutes / 60, 2)
+        return round(obj.actual_minutes / 60, 2)
     
     def get_billable_hours(self, obj):
         """Calculate billable hours tracked on this project."""
-        from time_entries.models import TimeEntry
-        total_minutes = TimeEntry.objects.filter(
-            project=obj,
-            is_billable=True,
-            duration_minutes__isnull=False
-        ).aggregate(total=models.Sum('duration_minutes'))['total'] or 0
+        total_minutes = getattr(obj, 'billable_minutes', None)
+        if total_minutes is None:
+            from time_entries.models import TimeEntry
+            total_minutes = TimeEntry.objects.filter(
+                project=obj,
+                is_billable=True,
+                duration_minutes__isnull=False
+            ).aggregate(total=models.Sum('duration_minutes'))['total'] or 0
         return round(total_minutes / 60, 2)
     
     def get_total_cost(self, obj):
         """Calculate total project cost based on time entries."""
         from time_entries.models import TimeEntry
-        total_cost = Decimal('0.00')
         
-        time_entries = TimeEntry.objects.filter(
+        cache_key = cost_cache_key(obj.pk)
+        total_cost = cache.get(cache_key)
+        if total_cost is not None:
+            return total_cost
+        
+        # Price minutes in one aggregate; entries without a (non-zero) rate
+        # of their own bill at the project's rate
+        rated_total = TimeEntry.objects.filter(
             project=obj,
             duration_minutes__isnull=False
-        ).select_related('user')
+        ).aggregate(total=rated_minutes(obj.hourly_rate))['total']
         
-        for entry in time_entries:
-            hours = Decimal(str(entry.duration_minutes / 60))
-            rate = entry.hourly_rate or obj.hourly_rate or Decimal('0.00')
-            total_cost += hours * rate
+        total_cost = Decimal('0.00')
+        if rated_total:
+            total_cost = (Decimal(rated_total) / 60).quantize(Decimal('0.01'))
         
+        cache.set(cache_key, total_cost, COST_CACHE_TTL)
         return total_cost
     
     def get_progress_percentage(self, obj):
         """Calculate project progress based on task completion."""
-        from tasks.models import Task
-        tasks = Task.objects.filter(project=obj)
-        total_tasks = tasks.count()
+        tasks_progress = getattr(obj, 'tasks_progress', None)
+        if tasks_progress is not None:
+            return round(tasks_progress, 1)
         
-        if total_tasks == 0:
+        cache_key = progress_cache_key(obj.pk)
+        counts = cache.get(cache_key)
+        
+        if counts is None:
+            from tasks.models import Task
+            counts = Task.objects.filter(project=obj).aggregate(
+                total=models.Count('id'),
+                completed=models.Count('id', filter=models.Q(status='done'))
+            )
+            if counts['total'] >= PROGRESS_CACHE_MIN_TASKS:
+                cache.set(cache_key, counts, PROGRESS_CACHE_TTL)
+        
+        if counts['total'] == 0:
             return 0
         
-        completed_tasks = tasks.filter(status='completed').count()
-        return round((completed_tasks / total_tasks) * 100, 1)
+        return round((counts['completed'] / counts['total']) * 100, 1)
+    
+    @cached_property
+    def today(self):
+        """Current date, resolved once per serializer instance."""
+        return timezone.now().date()
     
     def get_is_overdue(self, obj):
         """Check if project is overdue."""
+        annotated = getattr(obj, 'is_overdue', None)
+        if annotated is not None:
+            return annotated
+        
         if not obj.end_date:
             return False
-        return timezone.now().date() > obj.end_date and obj.status != 'completed'
+        return self.today > obj.end_date and obj.status != 'completed'
     
     def get_is_over_budget(self, obj):
         """Check if project is over budget hours."""
@@ -156,7 +191,10 @@ class ProjectSerializer(serializers.ModelSerializer):
     
     def get_team_size(self, obj):
         """Get number of team members."""
-        return obj.members.count()
+        members_total = getattr(obj, 'members_total', None)
+        if members_total is None:
+            return obj.members.count()
+        return members_total
     
     def validate(self, data):
         """Validate project data."""
@@ -233,16 +271,56 @@ class ProjectSummarySerializer(serializers.ModelSerializer):
     
     def get_total_hours(self, obj):
         """Calculate total hours tracked on this project."""
-        from time_entries.models import TimeEntry
-        total_minutes = TimeEntry.objects.filter(
-            project=obj,
-            duration_minutes__isnull=False
-        ).aggregate(total=models.Sum('duration_minutes'))['total'] or 0
-        return round(total_minutes / 60, 2)
+        return round(obj.actual_minutes / 60, 2)
     
     def get_team_size(self, obj):
         """Get number of team members."""
-        return obj.members.count()
+        members_total = getattr(obj, 'members_total', None)
+        if members_total is None:
+            return obj.members.count()
+        return members_total
+    
+    @staticmethod
+    def summary_values(queryset):
+        """
+        Select the summary fields of a with_stats() queryset as plain rows.
+        
+        Only the annotations named here are computed, and no model instances
+        are built; render the rows with represent_values().
+        """
+        return queryset.values(
+            'id', 'name', 'color', 'status', 'billing_type', 'start_date', 'end_date',
+            'client', 'manager', 'actual_minutes', 'members_total',
+            client_name=models.F('client__name'),
+            manager_first_name=models.F('manager__first_name'),
+            manager_last_name=models.F('manager__last_name')
+        )
+    
+    @staticmethod
+    def represent_values(rows):
+        """Render summary_values() rows exactly as serializing instances would."""
+        data = []
+        for row in rows:
+            item = {
+                'id': str(row['id']),
+                'name': row['name'],
+                'color': row['color'],
+                'status': row['status'],
+                'billing_type': row['billing_type'],
+                'start_date': row['start_date'] and row['start_date'].isoformat(),
+                'end_date': row['end_date'] and row['end_date'].isoformat()
+            }
+            # Dotted sources over a null relation are left out, not None
+            if row['client'] is not None:
+                item['client_name'] = row['client_name']
+            if row['manager'] is not None:
+                item['manager_name'] = (
+                    f"{row['manager_first_name']} {row['manager_last_name']}".strip()
+                )
+            item['total_hours'] = round(row['actual_minutes'] / 60, 2)
+            item['team_size'] = row['members_total']
+            data.append(item)
+        return data
 
 
 class ProjectTimelineSerializer(serializers.Serializer):
@@ -331,17 +409,64 @@ class ProjectMemberActionSerializer(serializers.Serializer):
         return value
 
 
+class ProjectBulkMemberSerializer(serializers.Serializer):
+    """Serializer for adding several project members in one request."""
+    
+    user_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=500
+    )
+    role = serializers.ChoiceField(choices=ProjectMember.ROLE_CHOICES, required=False)
+    hourly_rate = serializers.DecimalField(
+        max_digits=10, 
+        decimal_places=2, 
+        required=False,
+        allow_null=True
+    )
+    allocation_percent = serializers.IntegerField(
+        min_value=1, 
+        max_value=100, 
+        required=False
+    )
+    
+    def validate_user_ids(self, value):
+        """Validate all users exist with a single query."""
+        user_ids = list(dict.fromkeys(value))
+        found = set(User.objects.filter(id__in=user_ids).values_list('id', flat=True))
+        missing = [str(user_id) for user_id in user_ids if user_id not in found]
+        if missing:
+            raise serializers.ValidationError(f"Users not found: {', '.join(missing)}")
+        return user_ids
+
+
+class QuantizedDecimalField(serializers.DecimalField):
+    """
+    DecimalField for values already rounded to `decimal_places`.
+    
+    Input is validated as usual; output is formatted as-is, skipping the
+    per-value quantize() with a max_digits context.
+    """
+    
+    def to_representation(self, value):
+        """Format the already-quantized decimal."""
+        if not getattr(self, 'coerce_to_string', api_settings.COERCE_DECIMAL_TO_STRING):
+            return value
+        return '{:f}'.format(value)
+
+
 class ProjectStatsSerializer(serializers.Serializer):
     """Serializer for project statistics and analytics."""
     
-    total_hours = serializers.DecimalField(max_digits=10, decimal_places=2)
-    billable_hours = serializers.DecimalField(max_digits=10, decimal_places=2)
-    total_cost = serializers.DecimalField(max_digits=12, decimal_places=2)
-    budget_utilization = serializers.DecimalField(max_digits=5, decimal_places=2)
+    # The stats view rounds every figure to cents before serializing
+    total_hours = QuantizedDecimalField(max_digits=10, decimal_places=2)
+    billable_hours = QuantizedDecimalField(max_digits=10, decimal_places=2)
+    total_cost = QuantizedDecimalField(max_digits=12, decimal_places=2)
+    budget_utilization = QuantizedDecimalField(max_digits=5, decimal_places=2)
     
     hours_by_user = serializers.SerializerMethodField()
     hours_by_week = serializers.SerializerMethodField()
-    task_completion_rate = serializers.DecimalField(max_digits=5, decimal_places=2)
+    task_completion_rate = QuantizedDecimalField(max_digits=5, decimal_places=2)
     
     def get_hours_by_user(self, obj):
         """Get hours breakdown by team member."""
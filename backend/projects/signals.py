@@ -0,0 +1,45 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Project, ProjectMember
+from .cache import invalidate_dashboards, invalidate_project_stats
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def handle_project_change(sender, instance, **kwargs):
+    """Invalidate cached dashboards and statistics for a changed project."""
+    try:
+        # A handed-over project also leaves the previous manager's dashboards
+        user_ids = [instance.manager_id, getattr(instance, '_loaded_manager_id', None)]
+        if not kwargs.get('created'):
+            user_ids += list(
+                ProjectMember.objects.filter(project_id=instance.pk).values_list('user_id', flat=True)
+            )
+
+        # A project moved to another workspace also leaves the old one's
+        # dashboards
+        invalidate_dashboards(
+            user_ids, instance.workspace_id, getattr(instance, '_loaded_workspace_id', None)
+        )
+        # Rates and budget feed into the cached statistics
+        invalidate_project_stats(instance.pk)
+
+    except Exception as e:
+        logger.error(f"Error invalidating project caches: {e}")
+
+
+@receiver(post_save, sender=ProjectMember)
+@receiver(post_delete, sender=ProjectMember)
+def handle_project_member_change(sender, instance, **kwargs):
+    """Invalidate the dashboard of a user joining or leaving a project."""
+    try:
+        workspace_id = Project.objects.filter(pk=instance.project_id).values_list(
+            'workspace_id', flat=True
+        ).first()
+        invalidate_dashboards([instance.user_id], workspace_id)
+
+    except Exception as e:
+        logger.error(f"Error invalidating project member dashboard: {e}")
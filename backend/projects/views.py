@@ -1,20 +1,54 @@
 from rest_framework import viewsets, status, permissions, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.pagination import CursorPagination
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.db import transaction
-from django.db.models import Q, Sum, Count, Avg
+from django.core.cache import cache
+from django.db.models import Q, Sum, Count, Avg, Prefetch, Exists, OuterRef, Subquery
 from decimal import Decimal
+import uuid
 from datetime import datetime, timedelta
 
-from .models import Client, Project, ProjectMember, Epic
+from .models import Client, Project, ProjectMember, Epic, project_total, rated_minutes
+from .cache import (
+    DASHBOARD_CACHE_TTL, STATS_CACHE_TTL, dashboard_cache_key, stats_cache_key,
+    invalidate_dashboards
+)
 from .serializers import (
     ClientSerializer, ProjectSerializer, ProjectCreateSerializer,
     ProjectSummarySerializer, ProjectMemberSerializer, ProjectTimelineSerializer,
-    ProjectMemberActionSerializer, ProjectStatsSerializer
+    ProjectMemberActionSerializer, ProjectBulkMemberSerializer, ProjectStatsSerializer
 )
 from organizations.models import Workspace
-from iam.models import User
+
+
+# Choice keys used by the dashboard and report breakdowns, built once at import
+PROJECT_STATUS_KEYS = tuple(key for key, _label in Project.STATUS_CHOICES)
+PROJECT_BILLING_KEYS = tuple(key for key, _label in Project.BILLING_TYPES)
+
+MINUTES_PER_HOUR = Decimal(60)
+
+
+def minutes_to_hours(minutes):
+    """Convert a minute total to hours rounded to cents precision."""
+    if not minutes:
+        return Decimal('0.00')
+    return (Decimal(minutes) / MINUTES_PER_HOUR).quantize(Decimal('0.01'))
+
+
+class UserWorkspacesMixin:
+    """
+    Resolves the requesting user's workspace ids once per request.
+    """
+    
+    @cached_property
+    def user_workspace_ids(self):
+        """Workspace ids the requesting user is a member of."""
+        return list(
+            self.request.user.memberships.values_list('workspace_id', flat=True)
+        )
 
 
 class ClientViewSet(viewsets.ModelViewSet):
@@ -27,27 +61,29 @@ class ClientViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filter clients based on user's organization."""
         user = self.request.user
-        # Get user's workspaces and their organizations
-        workspace_ids = user.memberships.values_list('workspace_id', flat=True)
-        org_ids = Workspace.objects.filter(id__in=workspace_ids).values_list('organization_id', flat=True)
-        
+        # Match organizations through a subquery rather than a join, so each
+        # client appears once and the project totals aren't multiplied
         return Client.objects.filter(
-            organization_id__in=org_ids
-        ).prefetch_related('projects')
+            organization__in=Workspace.objects.filter(
+                memberships__user=user
+            ).values('organization')
+        ).with_project_totals()
     
     def perform_create(self, serializer):
         """Set organization when creating client."""
         workspace_id = self.request.data.get('workspace')
         if workspace_id:
-            workspace = Workspace.objects.get(id=workspace_id)
+            workspace = Workspace.objects.select_related('organization').get(id=workspace_id)
             serializer.save(organization=workspace.organization)
         else:
             # Default to first organization user has access to
-            workspace = self.request.user.memberships.first().workspace
-            serializer.save(organization=workspace.organization)
+            membership = self.request.user.memberships.select_related(
+                'workspace__organization'
+            ).first()
+            serializer.save(organization=membership.workspace.organization)
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(UserWorkspacesMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing projects with comprehensive CRUD operations.
     """
@@ -65,19 +101,30 @@ class ProjectViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         """Filter projects based on user permissions."""
-        user = self.request.user
-        
         # Get projects from workspaces user has access to
-        workspace_ids = user.memberships.values_list('workspace_id', flat=True)
-        
         queryset = Project.objects.filter(
-            workspace_id__in=workspace_ids
-        ).select_related(
-            'client', 'manager', 'workspace'
-        ).prefetch_related(
-            'members__user'
+            workspace_id__in=self.user_workspace_ids
         )
         
+        if self.action == 'list':
+            # Summary serializer reads annotated totals instead of members
+            queryset = queryset.for_list()
+        else:
+            queryset = queryset.select_related(
+                'client', 'manager', 'workspace'
+            ).prefetch_related(
+                Prefetch('members', queryset=ProjectMember.objects.select_related('user'))
+            )
+        
+        if self.action in ('list', 'retrieve', 'update', 'partial_update'):
+            # Totals read by the serializers; the dashboard aggregates over
+            # this queryset, so it annotates only the recent projects instead
+            queryset = queryset.with_stats()
+        
+        if self.action == 'retrieve':
+            # Updates change end_date and status, so only reads use the flag
+            queryset = queryset.with_overdue()
+        
         # Filter by workspace if specified
         workspace_id = self.request.query_params.get('workspace')
         if workspace_id:
@@ -93,7 +140,14 @@ class ProjectViewSet(viewsets.ModelViewSet):
         if manager_id:
             queryset = queryset.filter(manager_id=manager_id)
         
-        # Search by name
+        # Filter overdue projects in the database
+        if self.request.query_params.get('overdue') in ('true', '1'):
+            if self.action != 'retrieve':
+                queryset = queryset.with_overdue()
+            queryset = queryset.filter(is_overdue=True)
+        
+        # Search by name; on PostgreSQL these ILIKE lookups are served by
+        # the pg_trgm GIN indexes from projects migration 0002
         search = self.request.query_params.get('search')
         if search:
             queryset = queryset.filter(
@@ -104,18 +158,40 @@ class ProjectViewSet(viewsets.ModelViewSet):
         
         return queryset.order_by('-created_at')
     
+    def list(self, request, *args, **kwargs):
+        """
+        List project summaries rendered straight from .values() rows.
+        
+        Summaries are read-only, so a page skips building model instances
+        and running the serializer's per-field loop for every project.
+        """
+        queryset = ProjectSummarySerializer.summary_values(
+            self.filter_queryset(self.get_queryset())
+        )
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                ProjectSummarySerializer.represent_values(page)
+            )
+        return Response(ProjectSummarySerializer.represent_values(queryset))
+    
+    @transaction.atomic
     def perform_create(self, serializer):
-        """Set workspace when creating project."""
-        workspace_id = self.request.data.get('workspace')
+        """Set workspace when creating project and its initial members."""
         try:
-            workspace = Workspace.objects.get(id=workspace_id)
-            # Verify user has access to workspace
-            user_workspaces = self.request.user.memberships.values_list('workspace_id', flat=True)
-            if workspace.id not in user_workspaces:
-                raise PermissionError("Access denied to this workspace")
-            
-            serializer.save(workspace=workspace)
-        except Workspace.DoesNotExist:
+            workspace_id = uuid.UUID(str(self.request.data.get('workspace')))
+        except ValueError:
+            raise serializers.ValidationError("Invalid workspace")
+        
+        # Members are verified against the request's cached workspace ids,
+        # so the workspace row is only read to tell a missing workspace
+        # from one the user can't access
+        if workspace_id in self.user_workspace_ids:
+            serializer.save(workspace_id=workspace_id)
+        elif Workspace.objects.filter(id=workspace_id).exists():
+            raise PermissionError("Access denied to this workspace")
+        else:
             raise serializers.ValidationError("Invalid workspace")
     
     @action(detail=True, methods=['get'])
@@ -130,42 +206,57 @@ class ProjectViewSet(viewsets.ModelViewSet):
         """Get project statistics and analytics."""
         project = self.get_object()
         
+        cache_key = stats_cache_key(project.id)
+        stats_data = cache.get(cache_key)
+        if stats_data is not None:
+            return Response(stats_data)
+        
         # Calculate statistics
         from time_entries.models import TimeEntry
+        from tasks.models import Task
         
-        time_entries = TimeEntry.objects.filter(project=project)
-        
-        total_minutes = time_entries.aggregate(
-            total=Sum('duration_minutes')
-        )['total'] or 0
-        
-        billable_minutes = time_entries.filter(is_billable=True).aggregate(
-            total=Sum('duration_minutes')
-        )['total'] or 0
-        
-        total_hours = Decimal(str(total_minutes / 60)) if total_minutes else Decimal('0.00')
-        billable_hours = Decimal(str(billable_minutes / 60)) if billable_minutes else Decimal('0.00')
-        
-        # Calculate total cost
-        total_cost = Decimal('0.00')
-        for entry in time_entries.filter(duration_minutes__isnull=False).select_related('user'):
-            hours = Decimal(str(entry.duration_minutes / 60))
-            rate = entry.hourly_rate or project.hourly_rate or Decimal('0.00')
-            total_cost += hours * rate
-        
-        # Calculate budget utilization
+        # Every total is a correlated subquery on the project's own row, so
+        # the time and task statistics come back in a single round trip
+        # without hydrating TimeEntry/Task instances
+        time_entries = TimeEntry.objects.filter(project=OuterRef('pk'))
+        tasks = Task.objects.filter(project=OuterRef('pk'))
+        totals = Project.objects.filter(pk=project.pk).annotate(
+            total_minutes=project_total(time_entries, Sum('duration_minutes')),
+            billable_minutes=project_total(
+                time_entries.filter(is_billable=True), Sum('duration_minutes')
+            ),
+            rated_minutes=Subquery(
+                time_entries.order_by().values('project').annotate(
+                    total=rated_minutes(project.hourly_rate)
+                ).values('total')
+            ),
+            tasks_total=project_total(tasks, Count('id')),
+            tasks_completed=project_total(tasks.filter(status='done'), Count('id'))
+        ).values(
+            'total_minutes', 'billable_minutes', 'rated_minutes',
+            'tasks_total', 'tasks_completed'
+        ).get()
+        
+        # Minute sums are exact integers, so convert with Decimal arithmetic
+        # rather than a float division round-tripped through str()
+        total_hours = minutes_to_hours(totals['total_minutes'])
+        billable_hours = minutes_to_hours(totals['billable_minutes'])
+        total_cost = minutes_to_hours(totals['rated_minutes'])  # rate per hour
+        
+        # Calculate budget utilization; rates are rounded to cents here, as
+        # the hour totals are, so the serializer only has to format them
         budget_utilization = Decimal('0.00')
         if project.budget_hours:
-            budget_utilization = (total_hours / project.budget_hours) * 100
+            budget_utilization = (
+                (total_hours / project.budget_hours) * 100
+            ).quantize(Decimal('0.01'))
         
         # Calculate task completion rate
-        from tasks.models import Task
-        tasks = Task.objects.filter(project=project)
-        total_tasks = tasks.count()
-        completed_tasks = tasks.filter(status='completed').count()
         task_completion_rate = Decimal('0.00')
-        if total_tasks > 0:
-            task_completion_rate = (Decimal(str(completed_tasks)) / Decimal(str(total_tasks))) * 100
+        if totals['tasks_total'] > 0:
+            task_completion_rate = (
+                Decimal(totals['tasks_completed']) / Decimal(totals['tasks_total']) * 100
+            ).quantize(Decimal('0.01'))
         
         stats_data = {
             'total_hours': total_hours,
@@ -176,6 +267,7 @@ class ProjectViewSet(viewsets.ModelViewSet):
         }
         
         serializer = ProjectStatsSerializer(stats_data)
+        cache.set(cache_key, serializer.data, STATS_CACHE_TTL)
         return Response(serializer.data)
     
     @action(detail=True, methods=['post'])
@@ -185,38 +277,67 @@ class ProjectViewSet(viewsets.ModelViewSet):
         serializer = ProjectMemberActionSerializer(data=request.data)
         
         if serializer.is_valid():
-            user_id = serializer.validated_data['user_id']
+            # The serializer has already verified the user exists, so the
+            # unique (project, user) constraint is the only remaining check
+            member, created = ProjectMember.objects.get_or_create(
+                project=project,
+                user_id=serializer.validated_data['user_id'],
+                defaults={
+                    'role': serializer.validated_data.get('role', 'member'),
+                    'hourly_rate': serializer.validated_data.get('hourly_rate'),
+                    'allocation_percent': serializer.validated_data.get('allocation_percent', 100)
+                }
+            )
             
-            try:
-                user = User.objects.get(id=user_id)
-                
-                # Check if user is already a member
-                if ProjectMember.objects.filter(project=project, user=user).exists():
-                    return Response(
-                        {'error': 'User is already a project member'},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-                
-                # Create membership
-                member = ProjectMember.objects.create(
-                    project=project,
-                    user=user,
-                    role=serializer.validated_data.get('role', 'member'),
-                    hourly_rate=serializer.validated_data.get('hourly_rate'),
-                    allocation_percent=serializer.validated_data.get('allocation_percent', 100)
-                )
-                
-                member_serializer = ProjectMemberSerializer(member)
-                return Response(member_serializer.data, status=status.HTTP_201_CREATED)
-                
-            except User.DoesNotExist:
+            if not created:
                 return Response(
-                    {'error': 'User not found'},
-                    status=status.HTTP_404_NOT_FOUND
+                    {'error': 'User is already a project member'},
+                    status=status.HTTP_400_BAD_REQUEST
                 )
+            
+            member_serializer = ProjectMemberSerializer(member)
+            return Response(member_serializer.data, status=status.HTTP_201_CREATED)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
+    @action(detail=True, methods=['post'])
+    def add_members(self, request, pk=None):
+        """Add several team members to the project at once."""
+        project = self.get_object()
+        serializer = ProjectBulkMemberSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        user_ids = serializer.validated_data['user_ids']
+        existing = set(
+            ProjectMember.objects.filter(project=project, user_id__in=user_ids)
+            .values_list('user_id', flat=True)
+        )
+        new_user_ids = [user_id for user_id in user_ids if user_id not in existing]
+        
+        # One INSERT per batch; the unique (project, user) constraint absorbs
+        # members added concurrently since the lookup above
+        ProjectMember.objects.bulk_create([
+            ProjectMember(
+                project=project,
+                user_id=user_id,
+                role=serializer.validated_data.get('role', 'member'),
+                hourly_rate=serializer.validated_data.get('hourly_rate'),
+                allocation_percent=serializer.validated_data.get('allocation_percent', 100)
+            )
+            for user_id in new_user_ids
+        ], batch_size=500, ignore_conflicts=True)
+        
+        # bulk_create skips post_save, so refresh dashboards here
+        invalidate_dashboards(new_user_ids, project.workspace_id)
+        
+        members = ProjectMember.objects.filter(
+            project=project, user_id__in=new_user_ids
+        ).select_related('user')
+        return Response({
+            'added': ProjectMemberSerializer(members, many=True).data,
+            'skipped': [str(user_id) for user_id in user_ids if user_id in existing]
+        }, status=status.HTTP_201_CREATED)
+    
     @action(detail=True, methods=['delete'])
     def remove_member(self, request, pk=None):
         """Remove a team member from the project."""
@@ -251,75 +372,86 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        try:
-            member = ProjectMember.objects.get(project=project, user_id=user_id)
-            serializer = ProjectMemberActionSerializer(data=request.data, partial=True)
-            
-            if serializer.is_valid():
-                if 'role' in serializer.validated_data:
-                    member.role = serializer.validated_data['role']
-                if 'hourly_rate' in serializer.validated_data:
-                    member.hourly_rate = serializer.validated_data['hourly_rate']
-                if 'allocation_percent' in serializer.validated_data:
-                    member.allocation_percent = serializer.validated_data['allocation_percent']
-                
-                member.save()
-                
-                member_serializer = ProjectMemberSerializer(member)
-                return Response(member_serializer.data)
-            
+        serializer = ProjectMemberActionSerializer(data=request.data, partial=True)
+        if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-            
-        except ProjectMember.DoesNotExist:
+        
+        members = ProjectMember.objects.filter(project=project, user_id=user_id)
+        updates = {
+            field: value for field, value in serializer.validated_data.items()
+            if field in ('role', 'hourly_rate', 'allocation_percent')
+        }
+        
+        # Write only the changed columns in a single UPDATE
+        if updates:
+            found = members.update(**updates)
+        else:
+            found = members.exists()
+        
+        if not found:
             return Response(
                 {'error': 'Member not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        
+        member = members.select_related('user').get()
+        member_serializer = ProjectMemberSerializer(member)
+        return Response(member_serializer.data)
     
     @action(detail=True, methods=['post'])
     def duplicate(self, request, pk=None):
         """Duplicate a project as a template."""
         project = self.get_object()
         
-        # Create a copy of the project
-        new_project = Project.objects.create(
-            workspace=project.workspace,
-            name=f"{project.name} (Copy)",
-            description=project.description,
-            color=project.color,
-            status='planning',
-            billing_type=project.billing_type,
-            hourly_rate=project.hourly_rate,
-            fixed_price=project.fixed_price,
-            budget_hours=project.budget_hours,
-            require_time_entry_notes=project.require_time_entry_notes,
-            track_expenses=project.track_expenses,
-            manager=request.user  # Set current user as manager
-        )
-        
-        # Copy team members if requested
-        if request.data.get('copy_team', False):
-            for member in project.members.all():
-                ProjectMember.objects.create(
-                    project=new_project,
-                    user=member.user,
-                    role=member.role,
-                    hourly_rate=member.hourly_rate,
-                    allocation_percent=member.allocation_percent
-                )
-        
-        # Copy tasks if requested
-        if request.data.get('copy_tasks', False):
-            from tasks.models import Task
-            for task in project.tasks.all():
-                Task.objects.create(
-                    project=new_project,
-                    title=task.title,
-                    description=task.description,
-                    priority=task.priority,
-                    status='todo',  # Reset status
-                    estimated_hours=task.estimated_hours
+        with transaction.atomic():
+            # Create a copy of the project
+            new_project = Project.objects.create(
+                workspace=project.workspace,
+                name=f"{project.name} (Copy)",
+                description=project.description,
+                color=project.color,
+                status='planning',
+                billing_type=project.billing_type,
+                hourly_rate=project.hourly_rate,
+                fixed_price=project.fixed_price,
+                budget_hours=project.budget_hours,
+                require_time_entry_notes=project.require_time_entry_notes,
+                track_expenses=project.track_expenses,
+                manager=request.user  # Set current user as manager
+            )
+            
+            # Copy team members if requested
+            if request.data.get('copy_team', False):
+                new_members = ProjectMember.objects.bulk_create([
+                    ProjectMember(
+                        project=new_project,
+                        user_id=member.user_id,
+                        role=member.role,
+                        hourly_rate=member.hourly_rate,
+                        allocation_percent=member.allocation_percent
+                    )
+                    for member in project.members.all()
+                ])
+                # bulk_create skips post_save, so refresh dashboards here
+                invalidate_dashboards(
+                    [member.user_id for member in new_members],
+                    new_project.workspace_id
                 )
+            
+            # Copy tasks if requested
+            if request.data.get('copy_tasks', False):
+                from tasks.models import Task
+                Task.objects.bulk_create([
+                    Task(
+                        project=new_project,
+                        title=task.title,
+                        description=task.description,
+                        priority=task.priority,
+                        status='todo',  # Reset status
+                        estimated_hours=task.estimated_hours
+                    )
+                    for task in project.tasks.all()
+                ])
         
         serializer = ProjectSerializer(new_project, context={'request': request})
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -329,62 +461,93 @@ class ProjectViewSet(viewsets.ModelViewSet):
         """Get project dashboard data for current user."""
         user = request.user
         workspace_id = request.query_params.get('workspace')
+        if workspace_id:
+            # Parse the id so every spelling of a workspace shares a cache key
+            try:
+                workspace_id = uuid.UUID(workspace_id)
+            except ValueError:
+                raise serializers.ValidationError("Invalid workspace")
         
-        # Base queryset
-        queryset = self.get_queryset()
+        cache_key = dashboard_cache_key(user.id, workspace_id)
+        dashboard_data = cache.get(cache_key)
+        if dashboard_data is not None:
+            return Response(dashboard_data)
+        
+        # The cache key only covers the user and workspace, so the dashboard
+        # is built from all of the user's projects rather than get_queryset(),
+        # which applies the list filters (status, manager, search, overdue)
+        queryset = Project.objects.filter(
+            workspace_id__in=self.user_workspace_ids
+        ).for_list()
         if workspace_id:
             queryset = queryset.filter(workspace_id=workspace_id)
         
-        # Get user's projects (where they are members or managers)
-        user_projects = queryset.filter(
-            Q(members__user=user) | Q(manager=user)
-        ).distinct()
+        # Get user's projects (where they are members or managers); alias()
+        # keeps the membership subquery in WHERE instead of every SELECT list
+        user_projects = queryset.alias(
+            is_member=Exists(
+                ProjectMember.objects.filter(project=OuterRef('pk'), user=user)
+            )
+        ).filter(
+            Q(manager=user) | Q(is_member=True)
+        )
+        
+        # Calculate statistics and the status breakdown in one aggregate
+        counts = user_projects.aggregate(
+            total=Count('id'),
+            overdue=Count('id', filter=Q(
+                end_date__lt=timezone.now().date(),
+                status__in=['planning', 'active', 'on_hold']
+            )),
+            **{
+                status_key: Count('id', filter=Q(status=status_key))
+                for status_key in PROJECT_STATUS_KEYS
+            }
+        )
         
-        # Calculate statistics
-        total_projects = user_projects.count()
-        active_projects = user_projects.filter(status='active').count()
-        overdue_projects = user_projects.filter(
-            end_date__lt=timezone.now().date(),
-            status__in=['planning', 'active', 'on_hold']
-        ).count()
-        
-        # Recent projects
-        recent_projects = user_projects.order_by('-updated_at')[:5]
-        
-        # Projects by status
-        status_breakdown = {}
-        for status_choice in Project.STATUS_CHOICES:
-            status_key = status_choice[0]
-            status_breakdown[status_key] = user_projects.filter(status=status_key).count()
+        # Recent projects (get_queryset already limits dashboard rows to the
+        # summary columns)
+        recent_projects = user_projects.with_stats().order_by('-updated_at')[:5]
         
         dashboard_data = {
             'summary': {
-                'total_projects': total_projects,
-                'active_projects': active_projects,
-                'overdue_projects': overdue_projects
+                'total_projects': counts['total'],
+                'active_projects': counts['active'],
+                'overdue_projects': counts['overdue']
+            },
+            'status_breakdown': {
+                status_key: counts[status_key] for status_key in PROJECT_STATUS_KEYS
             },
-            'status_breakdown': status_breakdown,
             'recent_projects': ProjectSummarySerializer(recent_projects, many=True).data
         }
         
+        cache.set(cache_key, dashboard_data, DASHBOARD_CACHE_TTL)
         return Response(dashboard_data)
 
 
-class ProjectMemberViewSet(viewsets.ReadOnlyModelViewSet):
+class ProjectMemberCursorPagination(CursorPagination):
+    """
+    Keyset pagination over members, backed by the (joined_at, id) index.
+    """
+    ordering = ('joined_at', 'id')
+
+
+class ProjectMemberViewSet(UserWorkspacesMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing project team members.
     """
     serializer_class = ProjectMemberSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ProjectMemberCursorPagination
     
     def get_queryset(self):
         """Filter members based on user's project access."""
-        user = self.request.user
-        workspace_ids = user.memberships.values_list('workspace_id', flat=True)
-        
         return ProjectMember.objects.filter(
-            project__workspace_id__in=workspace_ids
-        ).select_related('user', 'project').order_by('joined_at')
+            project__workspace_id__in=self.user_workspace_ids
+        ).select_related('user').only(
+            'id', 'user', 'role', 'hourly_rate', 'allocation_percent', 'joined_at',
+            'user__id', 'user__first_name', 'user__last_name', 'user__email', 'user__avatar_url'
+        ).order_by('joined_at', 'id')
 
 
 class ProjectReportViewSet(viewsets.ReadOnlyModelViewSet):
@@ -414,9 +577,11 @@ class ProjectReportViewSet(viewsets.ReadOnlyModelViewSet):
             try:
                 start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
                 end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+                # Projects whose timeline overlaps the requested period; a
+                # missing start or end date leaves that side unbounded
                 projects = projects.filter(
-                    Q(start_date__range=[start_date, end_date]) |
-                    Q(end_date__range=[start_date, end_date])
+                    Q(start_date__lte=end_date) | Q(start_date__isnull=True),
+                    Q(end_date__gte=start_date) | Q(end_date__isnull=True)
                 )
             except ValueError:
                 return Response(
@@ -424,36 +589,37 @@ class ProjectReportViewSet(viewsets.ReadOnlyModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST
                 )
         
-        # Calculate metrics
-        total_projects = projects.count()
-        
-        # Status distribution
-        status_dist = {}
-        for status_choice in Project.STATUS_CHOICES:
-            status_key = status_choice[0]
-            status_dist[status_key] = projects.filter(status=status_key).count()
-        
-        # Billing type distribution
-        billing_dist = {}
-        for billing_choice in Project.BILLING_TYPES:
-            billing_key = billing_choice[0]
-            billing_dist[billing_key] = projects.filter(billing_type=billing_key).count()
-        
-        # Calculate total budget and hours
-        total_budget = projects.aggregate(
+        # Calculate totals and both distributions in one aggregate
+        totals = projects.aggregate(
+            total=Count('id'),
             total_fixed=Sum('fixed_price'),
-            total_budget_hours=Sum('budget_hours')
+            total_budget_hours=Sum('budget_hours'),
+            **{
+                f'status_{status_key}': Count('id', filter=Q(status=status_key))
+                for status_key in PROJECT_STATUS_KEYS
+            },
+            **{
+                f'billing_{billing_key}': Count('id', filter=Q(billing_type=billing_key))
+                for billing_key in PROJECT_BILLING_KEYS
+            }
         )
         
+        status_dist = {
+            status_key: totals[f'status_{status_key}'] for status_key in PROJECT_STATUS_KEYS
+        }
+        billing_dist = {
+            billing_key: totals[f'billing_{billing_key}'] for billing_key in PROJECT_BILLING_KEYS
+        }
+        
         report_data = {
             'period': {
                 'start_date': start_date if start_date else None,
                 'end_date': end_date if end_date else None
             },
             'summary': {
-                'total_projects': total_projects,
-                'total_budget_value': total_budget['total_fixed'] or 0,
-                'total_budget_hours': total_budget['total_budget_hours'] or 0
+                'total_projects': totals['total'],
+                'total_budget_value': totals['total_fixed'] or 0,
+                'total_budget_hours': totals['total_budget_hours'] or 0
             },
             'status_distribution': status_dist,
             'billing_distribution': billing_dist
@@ -1,3 +1,41 @@
 from django.contrib import admin
+from .models import TaskDependency, TaskComment, TaskActivity
 
-# Register your models here.
+
+@admin.register(TaskDependency)
+class TaskDependencyAdmin(admin.ModelAdmin):
+    """Admin interface for TaskDependency model."""
+
+    list_display = ('__str__', 'dependency_type', 'created_at')
+    # __str__ reads both task titles
+    list_select_related = ('from_task', 'to_task')
+    list_filter = ('dependency_type', 'created_at')
+    search_fields = ('from_task__title', 'to_task__title')
+    raw_id_fields = ('from_task', 'to_task')
+
+
+@admin.register(TaskComment)
+class TaskCommentAdmin(admin.ModelAdmin):
+    """Admin interface for TaskComment model."""
+
+    list_display = ('__str__', 'is_internal', 'created_at')
+    # __str__ reads the task title and the author's email
+    list_select_related = ('task', 'author')
+    list_filter = ('is_internal', 'created_at')
+    search_fields = ('task__title', 'author__email', 'content')
+    raw_id_fields = ('task', 'author')
+    readonly_fields = ('created_at', 'updated_at')
+
+
+@admin.register(TaskActivity)
+class TaskActivityAdmin(admin.ModelAdmin):
+    """Admin interface for TaskActivity model."""
+
+    list_display = ('__str__', 'action', 'created_at')
+    # __str__ reads the task title and the acting user; user is nullable,
+    # so the admin's automatic select_related() would skip it
+    list_select_related = ('task', 'user')
+    list_filter = ('action', 'created_at')
+    search_fields = ('task__title', 'user__email', 'description')
+    raw_id_fields = ('task', 'user')
+    readonly_fields = ('created_at',)
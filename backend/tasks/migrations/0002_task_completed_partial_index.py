@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("status", "done")),
+                fields=["project"],
+                name="task_completed_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0002_task_completed_partial_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_project_fe19a5_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["project", "status", "order", "created_at"],
+                name="task_board_idx",
+            ),
+        ),
+    ]
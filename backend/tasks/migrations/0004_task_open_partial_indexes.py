@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0003_task_board_index"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="task",
+            name="tasks_due_dat_0359a9_idx",
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(
+                    ("status__in", ["todo", "in_progress", "review", "blocked"])
+                ),
+                fields=["project", "due_date"],
+                name="task_open_due_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("completed_at__isnull", True)),
+                fields=["assignee", "due_date"],
+                name="task_assignee_due_idx",
+            ),
+        ),
+    ]
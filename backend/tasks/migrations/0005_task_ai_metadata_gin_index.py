@@ -0,0 +1,31 @@
+# GIN index backing containment and key lookups on task AI metadata.
+
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    """Index ai_metadata so `contains`/`has_key` filters avoid a full scan."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS task_ai_meta_gin "
+        "ON tasks USING gin (ai_metadata)"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS task_ai_meta_gin")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0004_task_open_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
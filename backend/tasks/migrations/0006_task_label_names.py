@@ -0,0 +1,40 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:45
+
+from django.db import migrations, models
+import tasks.models
+
+
+def backfill_label_names(apps, schema_editor):
+    """Copy the names of each task's current labels onto it."""
+    Task = apps.get_model("tasks", "Task")
+    TaskLabelLink = Task.labels.through
+
+    names = {}
+    rows = TaskLabelLink.objects.order_by("tasklabel__name").values_list(
+        "task_id", "tasklabel__name"
+    )
+    for task_id, name in rows:
+        names.setdefault(task_id, []).append(name)
+
+    Task.objects.bulk_update(
+        [Task(pk=task_id, label_names=label_names) for task_id, label_names in names.items()],
+        ["label_names"],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0005_task_ai_metadata_gin_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="label_names",
+            field=models.JSONField(
+                blank=True, default=tasks.models.default_list, editable=False
+            ),
+        ),
+        migrations.RunPython(backfill_label_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,31 @@
+# BRIN index backing time-range scans of the append-only task activity log.
+
+from django.db import migrations
+
+
+def create_brin_index(apps, schema_editor):
+    """Index created_at with BRIN; rows arrive in time order, so it stays tiny."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS task_activity_created_brin "
+        "ON task_activities USING brin (created_at) WITH (pages_per_range = 32)"
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS task_activity_created_brin")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0006_task_label_names"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, drop_brin_index),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:47
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0007_task_activity_created_brin"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="tasklabel",
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name="tasktemplate",
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name="tasklabel",
+            constraint=models.UniqueConstraint(
+                models.F("workspace"),
+                django.db.models.functions.text.Upper("name"),
+                name="task_label_workspace_name_uniq",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="tasktemplate",
+            constraint=models.UniqueConstraint(
+                models.F("workspace"),
+                django.db.models.functions.text.Upper("name"),
+                name="task_template_workspace_name_uniq",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:48
+
+from django.db import migrations, models
+import tasks.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0008_case_insensitive_names"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="taskactivity",
+            name="id",
+            field=models.UUIDField(
+                default=tasks.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="taskcomment",
+            name="id",
+            field=models.UUIDField(
+                default=tasks.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="taskdependency",
+            name="id",
+            field=models.UUIDField(
+                default=tasks.models.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
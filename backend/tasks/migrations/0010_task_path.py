@@ -0,0 +1,45 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:55
+
+from django.db import migrations, models
+
+
+def backfill_paths(apps, schema_editor):
+    """Build each task's ancestor path, walking down from the root tasks."""
+    Task = apps.get_model("tasks", "Task")
+
+    children = {}
+    for task_id, parent_id in Task.objects.values_list("id", "parent_task_id"):
+        children.setdefault(parent_id, []).append(task_id)
+
+    updates = []
+    pending = [(task_id, "") for task_id in children.get(None, [])]
+    while pending:
+        task_id, path = pending.pop()
+        if path:
+            updates.append(Task(pk=task_id, path=path))
+        pending.extend(
+            (child_id, f"{path}{task_id}/") for child_id in children.get(task_id, [])
+        )
+
+    Task.objects.bulk_update(updates, ["path"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tasks", "0009_time_ordered_ids"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="path",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["path"], name="task_path_idx", opclasses=["text_pattern_ops"]
+            ),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,12 @@
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Value
+from django.db.models.functions import Concat, Length, Now, Substr, Upper
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
+import secrets
+import time
 import uuid
 
 
@@ -15,6 +20,43 @@ def default_list():
     return []
 
 
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7) for append-heavy tables.
+    
+    The leading 48 bits are the Unix time in milliseconds, so new rows land
+    at the right edge of the primary key index instead of on random pages.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (
+        (unix_ms & (1 << 48) - 1) << 80
+        | 0x7 << 76
+        | secrets.randbits(12) << 64
+        | 0b10 << 62
+        | secrets.randbits(62)
+    )
+    return uuid.UUID(int=value)
+
+
+# Statuses of tasks still being worked on
+OPEN_TASK_STATUSES = ['todo', 'in_progress', 'review', 'blocked']
+
+
+class TaskLabelQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for label listings.
+    """
+    
+    def with_usage_count(self):
+        """
+        Annotate how many tasks carry each label.
+        
+        Counting in the label query avoids a COUNT per label when a list
+        shows usage.
+        """
+        return self.annotate(usage_count=models.Count('tasks'))
+
+
 class TaskLabel(models.Model):
     """
     Labels/tags for categorizing tasks.
@@ -31,14 +73,143 @@ class TaskLabel(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = TaskLabelQuerySet.as_manager()
+    
     class Meta:
         db_table = 'task_labels'
-        unique_together = ['workspace', 'name']
+        constraints = [
+            # Case-insensitive, so "Bug" and "bug" can't both exist; UPPER
+            # matches what `name__iexact` compiles to, so lookups use the index
+            models.UniqueConstraint(
+                'workspace', Upper('name'), name='task_label_workspace_name_uniq'
+            ),
+        ]
+        
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded name so only renames recopy it onto tasks
+        instance._loaded_name = instance.__dict__.get('name')
+        return instance
         
     def __str__(self):
         return self.name
 
 
+def label_prefetch(lookup):
+    """
+    Prefetch a label relation loading only the columns labels render.
+    
+    Labels are many-to-many, so select_related('labels') does not apply;
+    prefetch them in one extra query instead.
+    """
+    return models.Prefetch(
+        lookup,
+        queryset=TaskLabel.objects.only('id', 'workspace', 'name', 'color')
+    )
+
+
+class TaskQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for task listings.
+    """
+    
+    def for_list(self):
+        """
+        Leave the free-text description and AI metadata out of list queries.
+        
+        Reading a deferred field on a listed task costs one query per row.
+        """
+        return self.defer('description', 'ai_metadata')
+    
+    def open(self):
+        """
+        Limit to tasks still being worked on.
+        
+        Matches the condition of the partial due-date index, so open-task
+        lookups by project and due date read only the open rows.
+        """
+        return self.filter(status__in=OPEN_TASK_STATUSES)
+    
+    def with_relations(self):
+        """
+        Join the task's foreign keys and prefetch its labels and outgoing
+        dependencies, so rendering a page of tasks costs a fixed number of
+        queries instead of several per task.
+        """
+        return self.select_related(
+            'project', 'epic', 'sprint', 'parent_task', 'assignee', 'created_by'
+        ).prefetch_related(*Task.default_prefetches())
+    
+    def with_activity(self):
+        """Prefetch comments and the activity log along with their authors."""
+        return self.prefetch_related(
+            models.Prefetch(
+                'comments',
+                queryset=TaskComment.objects.select_related('author')
+            ),
+            models.Prefetch(
+                'activities',
+                queryset=TaskActivity.objects.select_related('user')
+            )
+        )
+    
+    def sync_label_names(self):
+        """
+        Recopy label names onto every task in the queryset.
+        
+        Reads the label rows in one query and writes them back with a single
+        bulk UPDATE. Returns a mapping of task id to its label names.
+        """
+        task_ids = list(self.order_by().values_list('pk', flat=True))
+        names = {task_id: [] for task_id in task_ids}
+        rows = Task.labels.through.objects.filter(task_id__in=task_ids).order_by(
+            'tasklabel__name'
+        ).values_list('task_id', 'tasklabel__name')
+        for task_id, name in rows:
+            names[task_id].append(name)
+        
+        Task.objects.bulk_update(
+            [Task(pk=task_id, label_names=label_names) for task_id, label_names in names.items()],
+            ['label_names']
+        )
+        return names
+    
+    def set_status(self, status, user=None):
+        """
+        Move every task in the queryset to `status` with a single UPDATE.
+        
+        Skips save() and its post_save handlers, so the affected projects'
+        cached statistics are invalidated here, and their progress recounted
+        with one grouped query, instead of per task. Tasks whose status
+        actually changes get a 'status_changed' activity, written in one
+        batched INSERT.
+        """
+        from projects.cache import invalidate_project_stats, refresh_project_progress
+        
+        rows = list(self.order_by().values_list('pk', 'project_id', 'status'))
+        project_ids = {project_id for _, project_id, _ in rows}
+        updated = self.update(status=status, updated_at=Now())
+        
+        TaskActivity.objects.log_many([
+            TaskActivity(
+                task_id=task_id,
+                user=user,
+                action='status_changed',
+                old_value={'status': old_status},
+                new_value={'status': status}
+            )
+            for task_id, _, old_status in rows
+            if old_status != status
+        ])
+        
+        for project_id in project_ids:
+            invalidate_project_stats(project_id)
+        refresh_project_progress(project_ids)
+        
+        return updated
+
+
 class Task(models.Model):
     """
     Individual task/work item.
@@ -89,6 +260,9 @@ class Task(models.Model):
         blank=True,
         related_name='subtasks'
     )
+    # Ancestor ids from the root down, each followed by '/', kept in step
+    # with parent_task on save so subtree lookups are one prefix match
+    path = models.TextField(blank=True, default='', editable=False)
     
     # Task details
     title = models.CharField(max_length=255)
@@ -127,6 +301,9 @@ class Task(models.Model):
     
     # Organization
     labels = models.ManyToManyField(TaskLabel, blank=True, related_name='tasks')
+    # Label names copied from `labels` by the signal handlers, so listings
+    # can show them without joining through the M2M table
+    label_names = models.JSONField(default=default_list, blank=True, editable=False)
     
     # AI-related fields
     ai_generated = models.BooleanField(default=False)
@@ -147,18 +324,146 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TaskQuerySet.as_manager()
+    
     class Meta:
         db_table = 'tasks'
         ordering = ['order', 'created_at']
         indexes = [
-            models.Index(fields=['project', 'status']),
+            # Board columns filter by project and status and read in default order
+            models.Index(
+                fields=['project', 'status', 'order', 'created_at'],
+                name='task_board_idx'
+            ),
             models.Index(fields=['assignee', 'status']),
-            models.Index(fields=['due_date']),
             models.Index(fields=['priority', 'due_date']),
+            # Due-date lookups only care about unfinished work
+            models.Index(
+                fields=['project', 'due_date'],
+                condition=models.Q(status__in=OPEN_TASK_STATUSES),
+                name='task_open_due_idx'
+            ),
+            models.Index(
+                fields=['assignee', 'due_date'],
+                condition=models.Q(completed_at__isnull=True),
+                name='task_assignee_due_idx'
+            ),
+            models.Index(
+                fields=['path'],
+                opclasses=['text_pattern_ops'],
+                name='task_path_idx'
+            ),
+            # Completed tasks per project feed every progress calculation
+            models.Index(
+                fields=['project'],
+                condition=models.Q(status='done'),
+                name='task_completed_idx'
+            ),
         ]
         
+    @classmethod
+    def default_prefetches(cls):
+        """
+        Prefetches for rendering tasks: labels and outgoing dependencies.
+        
+        Use as Task.objects.prefetch_related(*Task.default_prefetches()).
+        """
+        return [
+            label_prefetch('labels'),
+            models.Prefetch(
+                'dependencies_from',
+                queryset=TaskDependency.objects.select_related('to_task')
+            ),
+        ]
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded project and status so the signal handlers can
+        # skip cache invalidation for edits that leave task counts unchanged
+        instance._counted_state = (
+            instance.__dict__.get('project_id'),
+            instance.__dict__.get('status')
+        )
+        # The stored path is only stale once parent_task changes
+        instance._loaded_parent_id = instance.__dict__.get('parent_task_id')
+        return instance
+        
     def __str__(self):
         return self.title
+    
+    def save(self, *args, **kwargs):
+        """Save the task, rebuilding its path and its subtree's when re-parented."""
+        moved = not self._state.adding and (
+            getattr(self, '_loaded_parent_id', None) != self.parent_task_id
+        )
+        if self._state.adding or moved:
+            old_prefix = f'{self.path}{self.pk}/'
+            path = self._parent_path()
+            if moved and str(self.pk) in path.split('/'):
+                # The subtree UPDATE below would also match the new parent's
+                # subtree and corrupt its paths
+                raise ValidationError(
+                    {'parent_task': "A task can't be moved under itself or its subtasks."}
+                )
+            self.path = path
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'path'}
+        
+        super().save(*args, **kwargs)
+        self._loaded_parent_id = self.parent_task_id
+        
+        new_prefix = f'{self.path}{self.pk}/'
+        if moved and new_prefix != old_prefix:
+            # Rewrite the prefix of every descendant in one UPDATE
+            Task.objects.filter(path__startswith=old_prefix).update(
+                path=Concat(Value(new_prefix), Substr('path', len(old_prefix) + 1))
+            )
+    
+    def _parent_path(self):
+        if self.parent_task_id is None:
+            return ''
+        if Task.parent_task.is_cached(self):
+            parent_path = self.parent_task.path
+        else:
+            parent_path = Task.objects.filter(pk=self.parent_task_id).values_list(
+                'path', flat=True
+            ).get()
+        return f'{parent_path}{self.parent_task_id}/'
+    
+    def get_ancestors(self):
+        """Get the chain of parent tasks, root first, in one query."""
+        ancestor_ids = [task_id for task_id in self.path.split('/') if task_id]
+        return Task.objects.filter(pk__in=ancestor_ids).order_by(Length('path'))
+    
+    def get_descendants(self):
+        """Get every task nested below this one, at any depth, in one query."""
+        return Task.objects.filter(path__startswith=f'{self.path}{self.pk}/')
+    
+    def get_blocking_tasks(self):
+        """Get tasks that must be finished before this one."""
+        # Read task IDs straight off the dependency rows instead of joining
+        # them back onto tasks
+        return Task.objects.filter(
+            models.Q(pk__in=TaskDependency.objects.filter(
+                to_task=self, dependency_type='blocks'
+            ).values('from_task_id')) |
+            models.Q(pk__in=TaskDependency.objects.filter(
+                from_task=self, dependency_type='blocked_by'
+            ).values('to_task_id'))
+        )
+    
+    def get_blocked_tasks(self):
+        """Get tasks waiting on this one."""
+        return Task.objects.filter(
+            models.Q(pk__in=TaskDependency.objects.filter(
+                from_task=self, dependency_type='blocks'
+            ).values('to_task_id')) |
+            models.Q(pk__in=TaskDependency.objects.filter(
+                to_task=self, dependency_type='blocked_by'
+            ).values('from_task_id'))
+        )
 
 
 class TaskDependency(models.Model):
@@ -172,7 +477,7 @@ class TaskDependency(models.Model):
         ('duplicates', 'Duplicates'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     from_task = models.ForeignKey(
         Task,
         on_delete=models.CASCADE,
@@ -208,7 +513,7 @@ class TaskComment(models.Model):
     """
     Comments and updates on tasks.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     task = models.ForeignKey(
         Task,
         on_delete=models.CASCADE,
@@ -241,6 +546,21 @@ class TaskComment(models.Model):
         return f"Comment on {self.task.title} by {self.author.email}"
 
 
+class TaskActivityQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for writing the activity log.
+    """
+    
+    def log_many(self, activities, batch_size=500):
+        """
+        Write many activity rows with batched multi-row INSERTs.
+        
+        Bulk task changes should collect their activities and flush them
+        here once instead of saving one row per task.
+        """
+        return self.bulk_create(activities, batch_size=batch_size)
+
+
 class TaskActivity(models.Model):
     """
     Activity log for task changes.
@@ -256,7 +576,7 @@ class TaskActivity(models.Model):
         ('reopened', 'Reopened'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     task = models.ForeignKey(
         Task,
         on_delete=models.CASCADE,
@@ -278,6 +598,8 @@ class TaskActivity(models.Model):
     
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = TaskActivityQuerySet.as_manager()
+    
     class Meta:
         db_table = 'task_activities'
         ordering = ['-created_at']
@@ -286,6 +608,21 @@ class TaskActivity(models.Model):
         return f"{self.task.title} - {self.action} by {self.user}"
 
 
+class TaskTemplateQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for template listings.
+    """
+    
+    def for_list(self):
+        """
+        Leave the description body and checklist out of list queries.
+        
+        Both can be large and are only shown once a template is opened;
+        reading either on a listed template costs one query per row.
+        """
+        return self.defer('description_template', 'checklist')
+
+
 class TaskTemplate(models.Model):
     """
     Reusable task templates for common workflows.
@@ -332,9 +669,24 @@ class TaskTemplate(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TaskTemplateQuerySet.as_manager()
+    
     class Meta:
         db_table = 'task_templates'
-        unique_together = ['workspace', 'name']
+        constraints = [
+            models.UniqueConstraint(
+                'workspace', Upper('name'), name='task_template_workspace_name_uniq'
+            ),
+        ]
         
     def __str__(self):
         return self.name
+    
+    @classmethod
+    def default_prefetches(cls):
+        """
+        Prefetches for rendering templates: their default labels.
+        
+        Use as TaskTemplate.objects.prefetch_related(*TaskTemplate.default_prefetches()).
+        """
+        return [label_prefetch('default_labels')]
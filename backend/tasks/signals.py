@@ -0,0 +1,88 @@
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from projects.cache import invalidate_project_progress, invalidate_project_stats
+from .models import Task, TaskLabel
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def invalidate_project_caches(project_ids):
+    """Drop cached statistics and progress for the given projects."""
+    for project_id in project_ids:
+        invalidate_project_stats(project_id)
+        invalidate_project_progress(project_id)
+
+
+@receiver(post_save, sender=Task)
+def handle_task_save(sender, instance, created, **kwargs):
+    """Invalidate project caches when a save moves the task counts."""
+    current = (instance.project_id, instance.status)
+    counted = None if created else getattr(instance, '_counted_state', None)
+    instance._counted_state = current
+    
+    # Title, description and other edits leave totals and progress intact
+    if counted == current:
+        return
+    
+    try:
+        project_ids = {instance.project_id}
+        if counted is not None:
+            project_ids.add(counted[0])
+        invalidate_project_caches(project_ids)
+
+    except Exception as e:
+        logger.error(f"Error invalidating project stats for task: {e}")
+
+
+@receiver(post_delete, sender=Task)
+def handle_task_delete(sender, instance, **kwargs):
+    """Invalidate project caches when a task is removed."""
+    try:
+        invalidate_project_caches([instance.project_id])
+
+    except Exception as e:
+        logger.error(f"Error invalidating project stats for task: {e}")
+
+
+@receiver(m2m_changed, sender=Task.labels.through)
+def handle_task_labels_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Recopy label names onto tasks whose labels were added or removed."""
+    if reverse and action == 'pre_clear':
+        # The cleared tasks are gone by post_clear, so note them now
+        instance._label_task_ids = list(instance.tasks.values_list('pk', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    
+    if not reverse:
+        names = Task.objects.filter(pk=instance.pk).sync_label_names()
+        instance.label_names = names.get(instance.pk, [])
+    elif action == 'post_clear':
+        Task.objects.filter(pk__in=getattr(instance, '_label_task_ids', [])).sync_label_names()
+    else:
+        Task.objects.filter(pk__in=pk_set).sync_label_names()
+
+
+@receiver(post_save, sender=TaskLabel)
+def handle_label_save(sender, instance, created, **kwargs):
+    """Recopy a renamed label's name onto its tasks."""
+    loaded_name = None if created else getattr(instance, '_loaded_name', None)
+    instance._loaded_name = instance.name
+    
+    # Colour and description edits leave the copied names intact
+    if created or loaded_name == instance.name:
+        return
+    Task.objects.filter(labels=instance).sync_label_names()
+
+
+@receiver(pre_delete, sender=TaskLabel)
+def note_label_tasks(sender, instance, **kwargs):
+    """Note which tasks carry a label about to be deleted."""
+    instance._label_task_ids = list(instance.tasks.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=TaskLabel)
+def handle_label_delete(sender, instance, **kwargs):
+    """Drop a deleted label's name from the tasks that carried it."""
+    Task.objects.filter(pk__in=getattr(instance, '_label_task_ids', [])).sync_label_names()
@@ -7,7 +7,7 @@ from django.conf import settings
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Set up Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'main.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'main.test_settings')
 django.setup()
 
 # Common fixtures and configurations for tests
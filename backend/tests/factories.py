@@ -0,0 +1,43 @@
+"""
+Shared fixture builders for the test suite.
+"""
+
+from types import SimpleNamespace
+from django.contrib.auth import get_user_model
+from organizations.models import Organization, Workspace
+from projects.models import Project
+
+User = get_user_model()
+
+
+def make_scaffold(email='test@example.com', username='testuser'):
+    """
+    Create the user, organization, workspace and project most tests start from.
+
+    Returns a namespace with `user`, `organization`, `workspace` and
+    `project` attributes, meant to be called from setUpTestData so the
+    rows are built once per class.
+    """
+    user = User.objects.create_user(
+        username=username,
+        email=email,
+        password='testpass123'
+    )
+    organization = Organization.objects.create(
+        name='Test Organization',
+        slug='test-org'
+    )
+    workspace = Workspace.objects.create(
+        organization=organization,
+        name='Test Workspace'
+    )
+    project = Project.objects.create(
+        workspace=workspace,
+        name='Test Project'
+    )
+    return SimpleNamespace(
+        user=user,
+        organization=organization,
+        workspace=workspace,
+        project=project
+    )
@@ -0,0 +1,27 @@
+"""
+Shared TestCase mixins for the test suite.
+"""
+
+from unittest import mock
+from django.utils import timezone
+
+
+class TimeMixin:
+    """
+    Freeze django.utils.timezone.now() at `self.now` for each test.
+
+    Date-sensitive tests and the querysets they exercise then agree on
+    the current time, even across midnight. Set `cls.now` in
+    setUpTestData to pin a specific moment; tests may move `self.now`
+    to advance the clock.
+    """
+
+    now = None
+
+    def setUp(self):
+        super().setUp()
+        if self.now is None:
+            self.now = timezone.now()
+        patcher = mock.patch('django.utils.timezone.now', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
@@ -34,8 +34,9 @@ class AIModelTest(TestCase):
 
 
 class AIJobTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -43,16 +44,16 @@ class AIJobTest(TestCase):
         
         # Create organization and workspace
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
         
-        self.ai_model = AIModel.objects.create(
+        cls.ai_model = AIModel.objects.create(
             name='Test Model',
             model_type='timesheet_generation',
             version='1.0'
@@ -95,8 +96,9 @@ class AIJobTest(TestCase):
 
 
 class SmartTimesheetSuggestionTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -104,32 +106,32 @@ class SmartTimesheetSuggestionTest(TestCase):
         
         # Create organization and workspace
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
         
         # Create project
         from projects.models import Project
-        self.project = Project.objects.create(
-            workspace=self.workspace,
+        cls.project = Project.objects.create(
+            workspace=cls.workspace,
             name='Test Project'
         )
         
-        self.ai_model = AIModel.objects.create(
+        cls.ai_model = AIModel.objects.create(
             name='Test Model',
             model_type='timesheet_generation',
             version='1.0'
         )
         
-        self.ai_job = AIJob.objects.create(
-            user=self.user,
-            workspace=self.workspace,
-            model=self.ai_model,
+        cls.ai_job = AIJob.objects.create(
+            user=cls.user,
+            workspace=cls.workspace,
+            model=cls.ai_model,
             job_type='timesheet_generation',
             status='completed'
         )
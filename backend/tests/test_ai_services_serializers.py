@@ -11,7 +11,8 @@ from ai_services.serializers import (
     AIModelSerializer, AIJobSerializer, SmartTimesheetSuggestionSerializer,
     TimesheetSuggestionActionSerializer, TaskAssignmentRecommendationSerializer,
     TaskAssignmentAlternativeSerializer, TaskAssignmentActionSerializer,
-    AIInsightSerializer, InsightAcknowledgeSerializer, AIJobCreateSerializer
+    AIInsightSerializer, InsightAcknowledgeSerializer, AIJobCreateSerializer,
+    AIJobListSerializer
 )
 from organizations.models import Organization, Workspace
 from projects.models import Project
@@ -22,8 +23,9 @@ User = get_user_model()
 
 
 class AIModelSerializerTest(TestCase):
-    def setUp(self):
-        self.ai_model = AIModel.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.ai_model = AIModel.objects.create(
             name='Test Model',
             model_type='timesheet_generation',
             version='1.0',
@@ -64,32 +66,33 @@ class AIModelSerializerTest(TestCase):
 
 
 class AIJobSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.ai_model = AIModel.objects.create(
+        cls.ai_model = AIModel.objects.create(
             name='Test Model',
             model_type='timesheet_generation',
             version='1.0'
         )
 
-        self.ai_job = AIJob.objects.create(
-            user=self.user,
-            workspace=self.workspace,
-            model=self.ai_model,
+        cls.ai_job = AIJob.objects.create(
+            user=cls.user,
+            workspace=cls.workspace,
+            model=cls.ai_model,
             job_type='timesheet_generation',
             status='pending',
             input_data={'input': 'data'},
@@ -108,42 +111,57 @@ class AIJobSerializerTest(TestCase):
         self.assertIn('input_data', data)
         self.assertIn('output_data', data)
 
+    def test_ai_job_list_serialization(self):
+        """Test job listings render without loading the job payloads."""
+        jobs = AIJobListSerializer.setup_eager_loading(AIJob.objects.all())
+
+        with self.assertNumQueries(1):
+            data = AIJobListSerializer(jobs, many=True).data
+
+        self.assertEqual(data[0]['model_name'], 'Test Model')
+        self.assertNotIn('input_data', data[0])
+        self.assertEqual(
+            jobs[0].get_deferred_fields(),
+            {'input_data', 'output_data', 'result_metadata'}
+        )
+
 
 class SmartTimesheetSuggestionSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.project = Project.objects.create(
-            workspace=self.workspace,
+        cls.project = Project.objects.create(
+            workspace=cls.workspace,
             name='Test Project'
         )
 
-        self.task = Task.objects.create(
-            project=self.project,
+        cls.task = Task.objects.create(
+            project=cls.project,
             title='Test Task',
             description='Test Description'
         )
 
-        self.suggestion = SmartTimesheetSuggestion.objects.create(
-            user=self.user,
-            workspace=self.workspace,
+        cls.suggestion = SmartTimesheetSuggestion.objects.create(
+            user=cls.user,
+            workspace=cls.workspace,
             suggestion_type='pattern_based',
             date=datetime.date(2023, 1, 1),
-            project=self.project,
-            task=self.task,
+            project=cls.project,
+            task=cls.task,
             suggested_start_time=datetime.time(9, 0),
             suggested_end_time=datetime.time(17, 0),
             suggested_duration_minutes=480,
@@ -199,39 +217,40 @@ class TimesheetSuggestionActionSerializerTest(TestCase):
 
 
 class TaskAssignmentRecommendationSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.project = Project.objects.create(
-            workspace=self.workspace,
+        cls.project = Project.objects.create(
+            workspace=cls.workspace,
             name='Test Project'
         )
 
-        self.task = Task.objects.create(
-            project=self.project,
+        cls.task = Task.objects.create(
+            project=cls.project,
             title='Test Task',
             description='Test Description'
         )
 
-        self.recommendation = TaskAssignmentRecommendation.objects.create(
-            task=self.task,
-            project=self.project,
-            workspace=self.workspace,
+        cls.recommendation = TaskAssignmentRecommendation.objects.create(
+            task=cls.task,
+            project=cls.project,
+            workspace=cls.workspace,
             recommendation_type='skill_based',
-            recommended_assignee=self.user,
+            recommended_assignee=cls.user,
             confidence_score=0.88,
             reasoning='Best match for skills',
             analysis_data={'skills': ['python', 'django']}
@@ -248,6 +267,30 @@ class TaskAssignmentRecommendationSerializerTest(TestCase):
         self.assertEqual(data['project_name'], 'Test Project')
         self.assertEqual(data['recommended_assignee_name'], self.user.get_full_name())
 
+    def test_eager_loading_serializes_list_in_fixed_queries(self):
+        """Test eager loading keeps list serialization from querying per row."""
+        for i in range(2):
+            other_user = User.objects.create_user(
+                username=f'altuser{i}',
+                email=f'alt{i}@example.com',
+                password='testpass123'
+            )
+            TaskAssignmentAlternative.objects.create(
+                recommendation=self.recommendation,
+                user=other_user,
+                confidence_score=0.5,
+                ranking=2 - i,
+                reasoning='Alternative'
+            )
+
+        queryset = TaskAssignmentRecommendationSerializer.setup_eager_loading(
+            TaskAssignmentRecommendation.objects.all()
+        )
+        with self.assertNumQueries(2):
+            data = TaskAssignmentRecommendationSerializer(queryset, many=True).data
+
+        self.assertEqual([alt['ranking'] for alt in data[0]['alternatives']], [1, 2])
+
 
 class TaskAssignmentActionSerializerTest(TestCase):
     def test_accept_action_validation(self):
@@ -274,32 +317,33 @@ class TaskAssignmentActionSerializerTest(TestCase):
 
 
 class AIInsightSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.project = Project.objects.create(
-            workspace=self.workspace,
+        cls.project = Project.objects.create(
+            workspace=cls.workspace,
             name='Test Project'
         )
 
-        self.insight = AIInsight.objects.create(
+        cls.insight = AIInsight.objects.create(
             insight_type='productivity_trend',
-            workspace=self.workspace,
-            user=self.user,
-            project=self.project,
+            workspace=cls.workspace,
+            user=cls.user,
+            project=cls.project,
             title='Productivity Insight',
             description='User productivity has increased by 15%',
             severity='medium',
@@ -3,7 +3,7 @@ from unittest.mock import patch, MagicMock
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from ai_services.services import SmartTimesheetService, TaskAssignmentService
-from ai_services.models import AIJob
+from ai_services.models import AIJob, AIModel
 
 User = get_user_model()
 
@@ -69,6 +69,20 @@ class TaskAssignmentServiceTest(TestCase):
     def test_service_initialization(self):
         # Just testing that the service can be instantiated
         self.assertIsInstance(self.task_assignment_service, TaskAssignmentService)
+        
+    def test_active_model_looked_up_once_on_use(self):
+        with self.assertNumQueries(0):
+            service = TaskAssignmentService()
+        
+        ai_model = AIModel.objects.create(
+            name='Assigner',
+            model_type='task_assignment',
+            version='1.0',
+            status='active'
+        )
+        with self.assertNumQueries(1):
+            self.assertEqual(service.model, ai_model)
+            self.assertEqual(service.model, ai_model)
 
 
 class AIJobServiceTest(TestCase):
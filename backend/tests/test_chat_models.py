@@ -7,14 +7,15 @@ User = get_user_model()
 
 
 class ChatMessageModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='direct',
             room_id='test-room-123',
             name='Test Room'
@@ -45,8 +46,9 @@ class ChatMessageModelTest(TestCase):
 
 
 class ChatRoomModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -80,14 +82,15 @@ class ChatRoomModelTest(TestCase):
 
 
 class ChatRoomMembershipModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='direct',
             room_id='test-room-123',
             name='Test Room'
@@ -15,13 +15,15 @@ from chat.serializers import (
 )
 from organizations.models import Organization, Workspace
 import datetime
+import uuid
 
 User = get_user_model()
 
 
 class UserBasicSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123',
@@ -42,38 +44,39 @@ class UserBasicSerializerTest(TestCase):
 
 
 class ChatReactionSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='channel',
-            workspace=self.workspace,
+            workspace=cls.workspace,
             name='Test Room',
-            created_by=self.user
+            created_by=cls.user
         )
 
-        self.message = ChatMessage.objects.create(
-            room=self.room,
-            user=self.user,
+        cls.message = ChatMessage.objects.create(
+            room=cls.room,
+            user=cls.user,
             content='Test message'
         )
 
-        self.reaction = ChatReaction.objects.create(
-            message=self.message,
-            user=self.user,
+        cls.reaction = ChatReaction.objects.create(
+            message=cls.message,
+            user=cls.user,
             emoji='👍',
             emoji_name='thumbs_up'
         )
@@ -89,38 +92,39 @@ class ChatReactionSerializerTest(TestCase):
 
 
 class ChatMentionSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='channel',
-            workspace=self.workspace,
+            workspace=cls.workspace,
             name='Test Room',
-            created_by=self.user
+            created_by=cls.user
         )
 
-        self.message = ChatMessage.objects.create(
-            room=self.room,
-            user=self.user,
+        cls.message = ChatMessage.objects.create(
+            room=cls.room,
+            user=cls.user,
             content='Test message'
         )
 
-        self.mention = ChatMention.objects.create(
-            message=self.message,
-            user=self.user
+        cls.mention = ChatMention.objects.create(
+            message=cls.message,
+            user=cls.user
         )
 
     def test_chat_mention_serialization(self):
@@ -134,32 +138,33 @@ class ChatMentionSerializerTest(TestCase):
 
 
 class ChatMessageSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='channel',
-            workspace=self.workspace,
+            workspace=cls.workspace,
             name='Test Room',
-            created_by=self.user
+            created_by=cls.user
         )
 
-        self.message = ChatMessage.objects.create(
-            room=self.room,
-            user=self.user,
+        cls.message = ChatMessage.objects.create(
+            room=cls.room,
+            user=cls.user,
             content='Test message',
             message_type='text'
         )
@@ -174,6 +179,83 @@ class ChatMessageSerializerTest(TestCase):
         self.assertEqual(data['user']['email'], 'test@example.com')
         self.assertEqual(data['reply_count'], 0)
 
+    def test_chat_message_with_thread(self):
+        """Test thread listings count live replies without a query per message."""
+        ChatMessage.objects.bulk_create([
+            ChatMessage(
+                room=self.room,
+                user=self.user,
+                content=content,
+                parent_message=self.message,
+                is_deleted=is_deleted
+            )
+            for content, is_deleted in [
+                ('First reply', False), ('Second reply', False), ('Removed reply', True)
+            ]
+        ])
+
+        messages = ChatMessage.objects.filter(parent_message__isnull=True).with_thread()
+        with self.assertNumQueries(4):
+            data = ChatMessageSerializer(messages, many=True).data
+            replies = list(messages[0].replies.all())
+
+        self.assertEqual(data[0]['reply_count'], 2)
+        self.assertEqual(len(replies), 3)
+
+    def test_chat_message_load_thread(self):
+        """Test nested replies load level by level up to the depth limit."""
+        parent = self.message
+        for depth in range(3):
+            parent = ChatMessage.objects.create(
+                room=self.room,
+                user=self.user,
+                content=f'Reply {depth}',
+                parent_message=parent
+            )
+        ChatMessage.objects.create(
+            room=self.room,
+            user=self.user,
+            content='Removed reply',
+            parent_message=self.message,
+            is_deleted=True
+        )
+
+        # The tree itself, then its reactions and mentions
+        with self.assertNumQueries(3):
+            replies = self.message.load_thread(max_depth=2)
+
+        self.assertEqual(len(replies), 1)
+        self.assertEqual(replies[0].content, 'Reply 0')
+        self.assertEqual(replies[0].thread_replies[0].content, 'Reply 1')
+        self.assertEqual(replies[0].thread_replies[0].thread_replies, [])
+
+    def test_chat_message_represent_thread(self):
+        """Test a loaded thread renders nested without further queries."""
+        first = ChatMessage.objects.create(
+            room=self.room, user=self.user, content='First', parent_message=self.message
+        )
+        ChatMessage.objects.create(
+            room=self.room, user=self.user, content='Nested', parent_message=first
+        )
+        ChatMessage.objects.create(
+            room=self.room, user=self.user, content='Second', parent_message=self.message
+        )
+        ChatReaction.objects.create(message=first, user=self.user, emoji='👍', emoji_name='thumbs_up')
+
+        replies = self.message.load_thread()
+        with self.assertNumQueries(0):
+            data = ChatMessageSerializer.represent_thread(replies)
+
+        self.assertEqual([reply['content'] for reply in data], ['First', 'Second'])
+        self.assertEqual(data[0]['reply_count'], 1)
+        self.assertEqual(data[0]['reactions'][0]['emoji'], '👍')
+        self.assertEqual(data[0]['replies'][0]['content'], 'Nested')
+        self.assertEqual(data[0]['replies'][0]['replies'], [])
+        self.assertEqual(
+            {key: value for key, value in data[1].items() if key != 'replies'},
+            ChatMessageSerializer(replies[1]).data
+        )
+
     def test_chat_message_with_mentions_creation(self):
         """Test creating message with mentions."""
         mention_user = User.objects.create_user(
@@ -197,29 +279,47 @@ class ChatMessageSerializerTest(TestCase):
         self.assertEqual(message.mentions.count(), 1)
         self.assertEqual(message.mentions.first().user, mention_user)
 
+    def test_chat_message_unknown_mention_validation(self):
+        """Test mentioned users are checked in one query."""
+        unknown_id = uuid.uuid4()
+        data = {
+            'room': str(self.room.id),
+            'content': 'Test message',
+            'mention_user_ids': [str(self.user.id), str(self.user.id), str(unknown_id)]
+        }
+
+        serializer = ChatMessageSerializer(data=data)
+        with self.assertNumQueries(1):
+            user_ids = serializer.validate_mention_user_ids([self.user.id, self.user.id])
+        self.assertEqual(user_ids, [self.user.id])
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn(str(unknown_id), str(serializer.errors['mention_user_ids']))
+
 
 class ChatMessageCreateSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='channel',
-            workspace=self.workspace,
+            workspace=cls.workspace,
             name='Test Room',
-            created_by=self.user
+            created_by=cls.user
         )
 
     def test_valid_message_creation(self):
@@ -256,32 +356,33 @@ class ChatMessageCreateSerializerTest(TestCase):
 
 
 class ChatRoomMembershipSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='channel',
-            workspace=self.workspace,
+            workspace=cls.workspace,
             name='Test Room',
-            created_by=self.user
+            created_by=cls.user
         )
 
-        self.membership = ChatRoomMembership.objects.create(
-            room=self.room,
-            user=self.user,
+        cls.membership = ChatRoomMembership.objects.create(
+            room=cls.room,
+            user=cls.user,
             role='admin'
         )
 
@@ -296,41 +397,42 @@ class ChatRoomMembershipSerializerTest(TestCase):
 
 
 class ChatRoomSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='channel',
-            workspace=self.workspace,
+            workspace=cls.workspace,
             name='Test Room',
             description='Test Description',
-            created_by=self.user
+            created_by=cls.user
         )
 
         # Add membership
         ChatRoomMembership.objects.create(
-            room=self.room,
-            user=self.user,
+            room=cls.room,
+            user=cls.user,
             role='admin'
         )
 
         # Add a message
         ChatMessage.objects.create(
-            room=self.room,
-            user=self.user,
+            room=cls.room,
+            user=cls.user,
             content='Test message content'
         )
 
@@ -348,19 +450,20 @@ class ChatRoomSerializerTest(TestCase):
 
 
 class ChatRoomCreateSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
@@ -392,41 +495,42 @@ class ChatRoomCreateSerializerTest(TestCase):
 
 
 class ChatNotificationSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='channel',
-            workspace=self.workspace,
+            workspace=cls.workspace,
             name='Test Room',
-            created_by=self.user
+            created_by=cls.user
         )
 
-        self.message = ChatMessage.objects.create(
-            room=self.room,
-            user=self.user,
+        cls.message = ChatMessage.objects.create(
+            room=cls.room,
+            user=cls.user,
             content='Test message'
         )
 
-        self.notification = ChatNotification.objects.create(
+        cls.notification = ChatNotification.objects.create(
             notification_type='mention',
             title='You were mentioned',
             content='Test mention notification',
-            room=self.room,
-            message=self.message
+            room=cls.room,
+            message=cls.message
         )
 
     def test_chat_notification_serialization(self):
@@ -442,40 +546,41 @@ class ChatNotificationSerializerTest(TestCase):
 
 
 class ChatRoomListSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.room = ChatRoom.objects.create(
+        cls.room = ChatRoom.objects.create(
             room_type='channel',
-            workspace=self.workspace,
+            workspace=cls.workspace,
             name='Test Room',
-            created_by=self.user
+            created_by=cls.user
         )
 
         # Add membership
         ChatRoomMembership.objects.create(
-            room=self.room,
-            user=self.user,
+            room=cls.room,
+            user=cls.user,
             role='member'
         )
 
         # Add a message
         ChatMessage.objects.create(
-            room=self.room,
-            user=self.user,
+            room=cls.room,
+            user=cls.user,
             content='This is a longer message that should be truncated in preview'
         )
 
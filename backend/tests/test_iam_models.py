@@ -67,13 +67,14 @@ class OrganizationModelTest(TestCase):
 
 
 class OrganizationMembershipModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.org = Organization.objects.create(
+        cls.org = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
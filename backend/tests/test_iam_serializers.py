@@ -71,8 +71,9 @@ class UserRegistrationSerializerTest(TestCase):
 
 
 class CustomTokenObtainPairSerializerTest(APITestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123',
@@ -93,8 +94,9 @@ class CustomTokenObtainPairSerializerTest(APITestCase):
 
 
 class UserProfileSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123',
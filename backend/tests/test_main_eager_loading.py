@@ -0,0 +1,56 @@
+from django.test import TestCase
+from ai_services.models import TaskAssignmentRecommendation
+from ai_services.serializers import (
+    AIJobSerializer, AIJobListSerializer, TaskAssignmentRecommendationSerializer,
+    TaskAssignmentAlternativeSerializer
+)
+from chat.serializers import ChatMessageSerializer
+from main.eager_loading import eager_load, related_lookups
+from projects.serializers import ProjectSerializer, ProjectMemberSerializer
+
+
+class RelatedLookupsTest(TestCase):
+    """Test relation lookups derived from serializer fields."""
+
+    def test_dotted_sources_select_related(self):
+        """Test dotted sources join their relation and primary keys don't."""
+        self.assertEqual(related_lookups(AIJobSerializer), (('user', 'model'), ()))
+
+    def test_nested_lists_prefetch(self):
+        """Test nested list serializers become prefetches."""
+        self.assertEqual(
+            related_lookups(ProjectSerializer),
+            (('client', 'manager', 'workspace'), (('members', ProjectMemberSerializer),))
+        )
+        self.assertEqual(
+            [lookup for lookup, _ in related_lookups(ChatMessageSerializer)[1]],
+            ['mention_records', 'reactions']
+        )
+
+    def test_eager_load_nests_prefetch_querysets(self):
+        """Test nested prefetches are eager loaded for their own serializer."""
+        queryset = eager_load(
+            TaskAssignmentRecommendation.objects.all(),
+            TaskAssignmentRecommendationSerializer
+        )
+
+        prefetch, = queryset._prefetch_related_lookups
+        self.assertEqual(prefetch.prefetch_to, 'alternatives')
+        self.assertEqual(prefetch.queryset.query.select_related, {'user': {}})
+        self.assertEqual(
+            queryset.query.select_related,
+            {'task': {}, 'project': {}, 'recommended_assignee': {}}
+        )
+        self.assertEqual(related_lookups(TaskAssignmentAlternativeSerializer), (('user',), ()))
+
+    def test_subclass_extends_eager_loading(self):
+        """Test a subclass can build on the derived eager loading."""
+        queryset = AIJobListSerializer.setup_eager_loading(
+            AIJobSerializer.Meta.model.objects.all()
+        )
+
+        self.assertEqual(queryset.query.select_related, {'user': {}, 'model': {}})
+        self.assertEqual(
+            queryset.query.deferred_loading,
+            ({'input_data', 'output_data', 'result_metadata'}, True)
+        )
@@ -0,0 +1,43 @@
+import uuid
+from datetime import date, datetime, time, timezone as dt_timezone
+from decimal import Decimal
+from django.test import TestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from main.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTest(TestCase):
+    """Test the orjson renderer against DRF's JSON renderer."""
+
+    def setUp(self):
+        self.data = {
+            'id': uuid.uuid4(),
+            'name': 'Zoë – café\u2028\u2029',
+            'created_at': datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=dt_timezone.utc),
+            'day': date(2024, 1, 2),
+            'start': time(9, 30),
+            'total_cost': Decimal('35.00'),
+            'hours': 2.75,
+            'label': gettext_lazy('Draft'),
+            'results': [{'team_size': 1, 'client_name': None, 'is_overdue': False}],
+        }
+
+    def test_matches_json_renderer(self):
+        """Test compact output is identical to DRF's JSON renderer."""
+        self.assertEqual(
+            ORJSONRenderer().render(self.data),
+            JSONRenderer().render(self.data)
+        )
+
+    def test_indented_output_uses_json_renderer(self):
+        """Test indented responses fall back to DRF's JSON renderer."""
+        media_type = 'application/json; indent=2'
+        self.assertEqual(
+            ORJSONRenderer().render(self.data, media_type),
+            JSONRenderer().render(self.data, media_type)
+        )
+
+    def test_none_renders_empty(self):
+        """Test empty responses render no body."""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
@@ -30,8 +30,9 @@ class OrganizationModelTest(TestCase):
 
 
 class WorkspaceModelTest(TestCase):
-    def setUp(self):
-        self.organization = Organization.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
@@ -60,18 +61,19 @@ class WorkspaceModelTest(TestCase):
 
 
 class MembershipModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
         
@@ -445,12 +445,14 @@ class ProjectsAdminTest(TestCase):
     def test_admin_performance_considerations(self):
         """Test performance considerations for admin interfaces."""
         # Create multiple projects for performance testing
-        for i in range(10):
-            Project.objects.create(
+        Project.objects.bulk_create([
+            Project(
                 name=f'Performance Project {i}',
                 workspace=self.workspace,
                 client=self.client_obj
             )
+            for i in range(10)
+        ])
 
         # Test efficient counting
         project_count = Project.objects.filter(workspace=self.workspace).count()
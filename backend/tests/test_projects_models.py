@@ -1,16 +1,20 @@
 import pytest
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 from django.contrib.auth import get_user_model
-from projects.models import Client, Project, ProjectMember
+from projects.models import Client, Project, ProjectMember, Sprint
+from tests.factories import make_scaffold
+from tests.mixins import TimeMixin
 
 User = get_user_model()
 
 
 class ClientModelTest(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create organization first (required for Client)
         from organizations.models import Organization
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
@@ -41,8 +45,9 @@ class ClientModelTest(TestCase):
 
 
 class ProjectModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -50,12 +55,12 @@ class ProjectModelTest(TestCase):
         
         # Create organization and workspace first (required for Project)
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace',
             slug='test-workspace'
         )
@@ -87,9 +92,156 @@ class ProjectModelTest(TestCase):
         self.assertEqual(str(project), 'Test Project')
 
 
+class ProjectQuerySetTest(TimeMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        scaffold = make_scaffold()
+        cls.user = scaffold.user
+        cls.organization = scaffold.organization
+        cls.workspace = scaffold.workspace
+        cls.project = scaffold.project
+        
+    def test_client_project_totals(self):
+        from decimal import Decimal
+        client = Client.objects.create(organization=self.organization, name='Test Client')
+        Project.objects.create(
+            workspace=self.workspace, name='Fixed', client=client,
+            status='active', fixed_price=Decimal('500.00')
+        )
+        Project.objects.create(
+            workspace=self.workspace, name='Closed', client=client,
+            status='completed', fixed_price=Decimal('250.00')
+        )
+        
+        client = Client.objects.with_project_totals().get(pk=client.pk)
+        
+        self.assertEqual(client.projects_count, 1)
+        self.assertEqual(client.total_project_value, Decimal('750.00'))
+        
+    def test_with_stats(self):
+        from tasks.models import Task
+        ProjectMember.objects.create(project=self.project, user=self.user)
+        Task.objects.create(project=self.project, title='Open Task')
+        Task.objects.create(project=self.project, title='Done Task', status='done')
+        
+        project = Project.objects.with_stats().get(pk=self.project.pk)
+        
+        self.assertEqual(project.tasks_progress, 50.0)
+        self.assertEqual(project.members_total, 1)
+        self.assertEqual(project.billable_minutes, 0)
+        
+    def test_with_stats_without_tasks(self):
+        project = Project.objects.with_stats().get(pk=self.project.pk)
+        
+        self.assertEqual(project.tasks_progress, 0)
+        
+    def test_summary_values_match_serializer(self):
+        from projects.serializers import ProjectSummarySerializer
+        client = Client.objects.create(organization=self.organization, name='Test Client')
+        Project.objects.create(
+            workspace=self.workspace, name='Managed', client=client, manager=self.user
+        )
+        queryset = Project.objects.for_list().with_stats().order_by('name')
+        
+        with self.assertNumQueries(1):
+            rows = ProjectSummarySerializer.represent_values(
+                ProjectSummarySerializer.summary_values(queryset)
+            )
+        
+        expected = ProjectSummarySerializer(queryset, many=True).data
+        self.assertEqual(rows, [dict(item) for item in expected])
+
+    def test_rated_minutes_bills_unrated_entries_at_default(self):
+        from decimal import Decimal
+        from projects.models import rated_minutes
+        from time_entries.models import TimeEntry
+        for minutes, rate in [(60, Decimal('0.00')), (30, Decimal('50.00')), (30, None)]:
+            TimeEntry.objects.create(
+                user=self.user,
+                workspace=self.workspace,
+                project=self.project,
+                start_time=self.now,
+                duration_minutes=minutes,
+                hourly_rate=rate
+            )
+
+        total = TimeEntry.objects.filter(project=self.project).aggregate(
+            total=rated_minutes(Decimal('100.00'))
+        )['total']
+
+        # Zero and missing rates both fall back to the default rate
+        self.assertEqual(total, Decimal('10500.00'))
+
+    def test_for_list_defers_heavy_fields(self):
+        project = Project.objects.for_list().get(pk=self.project.pk)
+        
+        self.assertIn('description', project.get_deferred_fields())
+        self.assertNotIn('name', project.get_deferred_fields())
+        
+    def test_with_overdue(self):
+        from datetime import timedelta
+        yesterday = (self.now - timedelta(days=1)).date()
+        overdue = Project.objects.create(
+            workspace=self.workspace,
+            name='Overdue Project',
+            status='active',
+            end_date=yesterday
+        )
+        Project.objects.create(
+            workspace=self.workspace,
+            name='Completed Project',
+            status='completed',
+            end_date=yesterday
+        )
+        
+        projects = Project.objects.with_overdue()
+        
+        self.assertEqual(
+            list(projects.filter(is_overdue=True).values_list('pk', flat=True)),
+            [overdue.pk]
+        )
+        self.assertFalse(projects.get(pk=self.project.pk).is_overdue)
+
+
+class SprintQuerySetTest(TimeMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        scaffold = make_scaffold()
+        cls.user = scaffold.user
+        cls.organization = scaffold.organization
+        cls.workspace = scaffold.workspace
+        cls.project = scaffold.project
+        
+    def _sprint(self, name, status, start_offset, end_offset):
+        from datetime import timedelta
+        today = self.now.date()
+        return Sprint.objects.create(
+            project=self.project,
+            name=name,
+            status=status,
+            start_date=today + timedelta(days=start_offset),
+            end_date=today + timedelta(days=end_offset)
+        )
+        
+    def test_sync_statuses(self):
+        starting = self._sprint('Starting', 'planned', 0, 13)
+        upcoming = self._sprint('Upcoming', 'planned', 1, 14)
+        ending = self._sprint('Ending', 'active', -14, -1)
+        cancelled = self._sprint('Cancelled', 'cancelled', -14, -1)
+        
+        self.assertEqual(Sprint.objects.sync_statuses(), (1, 1))
+        
+        statuses = dict(Sprint.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses[starting.pk], 'active')
+        self.assertEqual(statuses[upcoming.pk], 'planned')
+        self.assertEqual(statuses[ending.pk], 'completed')
+        self.assertEqual(statuses[cancelled.pk], 'cancelled')
+
+
 class ProjectMemberModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -97,18 +249,18 @@ class ProjectMemberModelTest(TestCase):
         
         # Create organization and workspace first (required for Project)
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace',
             slug='test-workspace'
         )
         
-        self.project = Project.objects.create(
-            workspace=self.workspace,
+        cls.project = Project.objects.create(
+            workspace=cls.workspace,
             name='Test Project',
             slug='test-project'
         )
@@ -134,4 +286,23 @@ class ProjectMemberModelTest(TestCase):
         )
         
         expected_str = f"{self.user.username} in {self.project.name} ({member.role})"
-        self.assertEqual(str(member), expected_str)
\ No newline at end of file
+        self.assertEqual(str(member), expected_str)
+
+
+class ProjectMemberConstraintTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        scaffold = make_scaffold()
+        cls.user = scaffold.user
+        cls.organization = scaffold.organization
+        cls.workspace = scaffold.workspace
+        cls.project = scaffold.project
+        
+    def test_allocation_range_enforced_on_bulk_paths(self):
+        member = ProjectMember.objects.create(project=self.project, user=self.user)
+        
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ProjectMember.objects.filter(pk=member.pk).update(allocation_percent=150)
+        
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ProjectMember.objects.filter(pk=member.pk).update(allocation_percent=0)
@@ -1,15 +1,19 @@
 import pytest
-from django.test import TestCase
+import uuid
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from django.db.models import Prefetch
 from rest_framework.test import APITestCase
-from rest_framework import status
+from rest_framework import serializers, status
 from decimal import Decimal
 from datetime import date, timedelta
 from projects.models import Client, Project, ProjectMember
 from projects.serializers import (
     ClientSerializer, ProjectMemberSerializer, ProjectSerializer,
     ProjectCreateSerializer, ProjectSummarySerializer, ProjectTimelineSerializer,
-    ProjectMemberActionSerializer, ProjectStatsSerializer
+    ProjectMemberActionSerializer, ProjectBulkMemberSerializer, ProjectStatsSerializer
 )
 from organizations.models import Organization, Workspace
 from tasks.models import Task
@@ -19,8 +23,9 @@ User = get_user_model()
 
 
 class ClientSerializerTest(TestCase):
-    def setUp(self):
-        self.client_obj = Client.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.client_obj = Client.objects.create(
             name='Test Client',
             email='client@example.com',
             phone='+1234567890',
@@ -29,20 +34,20 @@ class ClientSerializerTest(TestCase):
             currency='USD'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
 
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.project = Project.objects.create(
+        cls.project = Project.objects.create(
             name='Test Project',
-            workspace=self.workspace,
-            client=self.client_obj,
+            workspace=cls.workspace,
+            client=cls.client_obj,
             billing_type='hourly',
             hourly_rate=Decimal('125.00')
         )
@@ -105,8 +110,9 @@ class ClientSerializerTest(TestCase):
 
 
 class ProjectMemberSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123',
@@ -114,24 +120,24 @@ class ProjectMemberSerializerTest(TestCase):
             last_name='User'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
 
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.project = Project.objects.create(
+        cls.project = Project.objects.create(
             name='Test Project',
-            workspace=self.workspace
+            workspace=cls.workspace
         )
 
-        self.member = ProjectMember.objects.create(
-            project=self.project,
-            user=self.user,
+        cls.member = ProjectMember.objects.create(
+            project=cls.project,
+            user=cls.user,
             role='developer',
             hourly_rate=Decimal('75.00'),
             allocation_percent=80
@@ -167,8 +173,9 @@ class ProjectMemberSerializerTest(TestCase):
 
 
 class ProjectSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='manager',
             email='manager@example.com',
             password='testpass123',
@@ -176,51 +183,52 @@ class ProjectSerializerTest(TestCase):
             last_name='Manager'
         )
 
-        self.client_obj = Client.objects.create(
+        cls.client_obj = Client.objects.create(
             name='Test Client',
             email='client@example.com'
         )
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
 
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.project = Project.objects.create(
+        today = timezone.localdate()
+        cls.project = Project.objects.create(
             name='Test Project',
             description='A test project',
-            workspace=self.workspace,
-            client=self.client_obj,
-            manager=self.user,
+            workspace=cls.workspace,
+            client=cls.client_obj,
+            manager=cls.user,
             billing_type='hourly',
             hourly_rate=Decimal('100.00'),
             budget_hours=100,
-            start_date=date.today(),
-            end_date=date.today() + timedelta(days=30)
+            start_date=today,
+            end_date=today + timedelta(days=30)
         )
 
         # Create some time entries
         TimeEntry.objects.create(
-            user=self.user,
-            workspace=self.workspace,
-            project=self.project,
+            user=cls.user,
+            workspace=cls.workspace,
+            project=cls.project,
             duration_minutes=480,  # 8 hours
             is_billable=True
         )
 
         # Create some tasks
         Task.objects.create(
-            project=self.project,
+            project=cls.project,
             title='Task 1',
-            status='completed'
+            status='done'
         )
         Task.objects.create(
-            project=self.project,
+            project=cls.project,
             title='Task 2',
             status='in_progress'
         )
@@ -261,15 +269,17 @@ class ProjectSerializerTest(TestCase):
     def test_project_overdue_check(self):
         """Test overdue project detection."""
         # Set end date to yesterday
-        self.project.end_date = date.today() - timedelta(days=1)
-        self.project.save()
+        Project.objects.filter(pk=self.project.pk).update(
+            end_date=date.today() - timedelta(days=1)
+        )
+        self.project.refresh_from_db(fields=['end_date'])
 
         serializer = ProjectSerializer(self.project)
         self.assertTrue(serializer.data['is_overdue'])
 
         # Set status to completed
-        self.project.status = 'completed'
-        self.project.save()
+        Project.objects.filter(pk=self.project.pk).update(status='completed')
+        self.project.refresh_from_db(fields=['status'])
 
         serializer = ProjectSerializer(self.project)
         self.assertFalse(serializer.data['is_overdue'])
@@ -290,10 +300,11 @@ class ProjectSerializerTest(TestCase):
     def test_project_validation(self):
         """Test Project validation."""
         # Test end date before start date
+        today = timezone.localdate()
         data = {
             'name': 'Invalid Project',
-            'start_date': date.today(),
-            'end_date': date.today() - timedelta(days=1)
+            'start_date': today,
+            'end_date': today - timedelta(days=1)
         }
 
         serializer = ProjectSerializer(data=data)
@@ -321,23 +332,119 @@ class ProjectSerializerTest(TestCase):
         self.assertFalse(serializer.is_valid())
 
 
-class ProjectCreateSerializerTest(TestCase):
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class ProjectSerializerQueriesTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='manager',
+            email='manager@example.com',
+            password='testpass123'
+        )
+        cls.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
+            name='Test Workspace'
+        )
+        cls.client_obj = Client.objects.create(
+            organization=cls.organization,
+            name='Test Client'
+        )
+
     def setUp(self):
-        self.user = User.objects.create_user(
+        cache.clear()
+
+    def _add_project(self, name):
+        member = User.objects.create_user(
+            username=f'{name}-member',
+            email=f'{name}@example.com',
+            password='testpass123'
+        )
+        project = Project.objects.create(
+            name=name,
+            workspace=self.workspace,
+            client=self.client_obj,
+            manager=self.user,
+            end_date=date.today() + timedelta(days=30)
+        )
+        ProjectMember.objects.create(project=project, user=member)
+        Task.objects.create(project=project, title='Task', status='done')
+        start_time = timezone.now()
+        TimeEntry.objects.create(
+            user=member,
+            workspace=self.workspace,
+            project=project,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=1),
+            is_billable=True
+        )
+
+    def _serialize(self):
+        # The queryset ProjectViewSet serves project details from
+        queryset = Project.objects.select_related(
+            'client', 'manager', 'workspace'
+        ).prefetch_related(
+            Prefetch('members', queryset=ProjectMember.objects.select_related('user'))
+        ).with_stats().with_overdue()
+        return ProjectSerializer(queryset, many=True).data
+
+    def test_serialization_queries_independent_of_rows(self):
+        """Test serializing projects doesn't query per project or member."""
+        self._add_project('first')
+        self._serialize()
+
+        # Projects, then their members; total costs come from the cache
+        with self.assertNumQueries(2):
+            self._serialize()
+
+        for name in ['second', 'third']:
+            self._add_project(name)
+        self._serialize()
+
+        with self.assertNumQueries(2):
+            data = self._serialize()
+
+        self.assertEqual(len(data), 3)
+        self.assertTrue(all(item['team_size'] == 1 for item in data))
+        self.assertTrue(all(item['progress_percentage'] == 100.0 for item in data))
+
+    def test_summary_serializes_from_list_columns(self):
+        """Test the summary serializer reads nothing for_list() leaves deferred."""
+        self._add_project('first')
+        project = Project.objects.for_list().with_stats().get()
+
+        with self.assertNumQueries(0):
+            data = ProjectSummarySerializer(project).data
+
+        self.assertIn('description', project.get_deferred_fields())
+        self.assertEqual(data['client_name'], 'Test Client')
+        self.assertEqual(data['total_hours'], 1.0)
+        self.assertEqual(data['team_size'], 1)
+
+
+class ProjectCreateSerializerTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='creator',
             email='creator@example.com',
             password='testpass123'
         )
 
-        self.client_obj = Client.objects.create(name='Test Client')
+        cls.client_obj = Client.objects.create(name='Test Client')
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
 
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
@@ -363,8 +470,9 @@ class ProjectCreateSerializerTest(TestCase):
 
 
 class ProjectSummarySerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='manager',
             email='manager@example.com',
             password='testpass123',
@@ -372,32 +480,32 @@ class ProjectSummarySerializerTest(TestCase):
             last_name='Manager'
         )
 
-        self.client_obj = Client.objects.create(name='Test Client')
+        cls.client_obj = Client.objects.create(name='Test Client')
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
 
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.project = Project.objects.create(
+        cls.project = Project.objects.create(
             name='Test Project',
-            workspace=self.workspace,
-            client=self.client_obj,
-            manager=self.user,
+            workspace=cls.workspace,
+            client=cls.client_obj,
+            manager=cls.user,
             billing_type='hourly',
             hourly_rate=Decimal('100.00')
         )
 
         # Add time entries
         TimeEntry.objects.create(
-            user=self.user,
-            workspace=self.workspace,
-            project=self.project,
+            user=cls.user,
+            workspace=cls.workspace,
+            project=cls.project,
             duration_minutes=240  # 4 hours
         )
 
@@ -415,44 +523,46 @@ class ProjectSummarySerializerTest(TestCase):
 
 
 class ProjectTimelineSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='manager',
             email='manager@example.com',
             password='testpass123'
         )
 
-        self.client_obj = Client.objects.create(name='Test Client')
+        cls.client_obj = Client.objects.create(name='Test Client')
 
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
 
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace'
         )
 
-        self.project = Project.objects.create(
+        today = timezone.localdate()
+        cls.project = Project.objects.create(
             name='Test Project',
-            workspace=self.workspace,
-            client=self.client_obj,
-            manager=self.user,
-            start_date=date.today(),
-            end_date=date.today() + timedelta(days=14)
+            workspace=cls.workspace,
+            client=cls.client_obj,
+            manager=cls.user,
+            start_date=today,
+            end_date=today + timedelta(days=14)
         )
 
         # Create tasks with due dates
         Task.objects.create(
-            project=self.project,
+            project=cls.project,
             title='Week 1 Task',
-            due_date=date.today() + timedelta(days=3)
+            due_date=today + timedelta(days=3)
         )
         Task.objects.create(
-            project=self.project,
+            project=cls.project,
             title='Week 2 Task',
-            due_date=date.today() + timedelta(days=10)
+            due_date=today + timedelta(days=10)
         )
 
     def test_project_timeline_serialization(self):
@@ -478,8 +588,9 @@ class ProjectTimelineSerializerTest(TestCase):
 
 
 class ProjectMemberActionSerializerTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -517,6 +628,43 @@ class ProjectMemberActionSerializerTest(TestCase):
         self.assertIn('user_id', serializer.errors)
 
 
+class ProjectBulkMemberSerializerTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        cls.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+
+    def test_valid_bulk_member_action(self):
+        """Test duplicate user IDs are collapsed in order."""
+        data = {
+            'user_ids': [str(self.user.id), str(self.other_user.id), str(self.user.id)],
+            'role': 'developer'
+        }
+
+        serializer = ProjectBulkMemberSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(
+            serializer.validated_data['user_ids'],
+            [self.user.id, self.other_user.id]
+        )
+
+    def test_unknown_user_id(self):
+        """Test unknown user IDs are rejected."""
+        data = {'user_ids': [str(self.user.id), str(uuid.uuid4())]}
+
+        serializer = ProjectBulkMemberSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('user_ids', serializer.errors)
+
+
 class ProjectStatsSerializerTest(TestCase):
     def test_project_stats_serialization(self):
         """Test ProjectStats serialization."""
@@ -546,4 +694,19 @@ class ProjectStatsSerializerTest(TestCase):
         self.assertEqual(serializer.get_hours_by_user(None), [])
 
         # Test hours_by_week method (returns empty list by default)
-        self.assertEqual(serializer.get_hours_by_week(None), [])
\ No newline at end of file
+        self.assertEqual(serializer.get_hours_by_week(None), [])
+
+    def test_project_stats_representation(self):
+        """Test quantized stats render as DecimalField would."""
+        stats = {
+            'total_hours': Decimal('40.50'),
+            'billable_hours': Decimal('0.00'),
+            'total_cost': Decimal('3825.00'),
+            'budget_utilization': Decimal('85.57'),
+            'task_completion_rate': Decimal('66.67')
+        }
+
+        data = ProjectStatsSerializer(stats).data
+        field = serializers.DecimalField(max_digits=12, decimal_places=2)
+        for name, value in stats.items():
+            self.assertEqual(data[name], field.to_representation(value))
@@ -0,0 +1,299 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from projects.models import Project, ProjectMember
+from projects.cache import (
+    cost_cache_key, dashboard_cache_key, progress_cache_key, stats_cache_key,
+    refresh_project_progress
+)
+from organizations.models import Organization, Workspace
+from tasks.models import Task
+
+User = get_user_model()
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class ProjectDashboardCacheSignalsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.member_user = User.objects.create_user(
+            username='memberuser',
+            email='member@example.com',
+            password='testpass123'
+        )
+
+        self.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        self.workspace = Workspace.objects.create(
+            organization=self.organization,
+            name='Test Workspace'
+        )
+
+        self.project = Project.objects.create(
+            workspace=self.workspace,
+            name='Test Project',
+            manager=self.user
+        )
+
+    def _prime(self, user):
+        keys = [
+            dashboard_cache_key(user.id, self.workspace.id),
+            dashboard_cache_key(user.id)
+        ]
+        for key in keys:
+            cache.set(key, {'summary': {}})
+        return keys
+
+    def test_project_save_invalidates_manager_dashboard(self):
+        """Test saving a project drops its manager's cached dashboards."""
+        keys = self._prime(self.user)
+
+        self.project.status = 'active'
+        self.project.save()
+
+        for key in keys:
+            self.assertIsNone(cache.get(key))
+
+    def test_project_save_invalidates_member_dashboard(self):
+        """Test saving a project drops its members' cached dashboards."""
+        ProjectMember.objects.create(project=self.project, user=self.member_user)
+        keys = self._prime(self.member_user)
+
+        self.project.save()
+
+        for key in keys:
+            self.assertIsNone(cache.get(key))
+
+    def test_member_changes_invalidate_dashboard(self):
+        """Test adding and removing a member drops their cached dashboards."""
+        keys = self._prime(self.member_user)
+        member = ProjectMember.objects.create(project=self.project, user=self.member_user)
+
+        for key in keys:
+            self.assertIsNone(cache.get(key))
+
+        keys = self._prime(self.member_user)
+        member.delete()
+
+        for key in keys:
+            self.assertIsNone(cache.get(key))
+
+    def test_project_move_invalidates_old_workspace_dashboard(self):
+        """Test moving a project drops dashboards of the workspace it left."""
+        other_workspace = Workspace.objects.create(
+            organization=self.organization,
+            name='Other Workspace'
+        )
+        keys = self._prime(self.user) + [dashboard_cache_key(self.user.id, other_workspace.id)]
+        cache.set(keys[-1], {'summary': {}})
+
+        project = Project.objects.get(pk=self.project.pk)
+        project.workspace = other_workspace
+        project.save()
+
+        for key in keys:
+            self.assertIsNone(cache.get(key))
+
+    def test_manager_change_invalidates_previous_manager_dashboard(self):
+        """Test handing a project over drops the previous manager's dashboards."""
+        keys = self._prime(self.user) + self._prime(self.member_user)
+
+        project = Project.objects.get(pk=self.project.pk)
+        project.manager = self.member_user
+        project.save()
+
+        for key in keys:
+            self.assertIsNone(cache.get(key))
+
+    def test_dashboard_key_ignores_workspace_id_spelling(self):
+        """Test UUID and string workspace ids share a dashboard key."""
+        self.assertEqual(
+            dashboard_cache_key(self.user.id, self.workspace.id),
+            dashboard_cache_key(self.user.id, str(self.workspace.id))
+        )
+
+    def test_unrelated_dashboard_is_kept(self):
+        """Test dashboards of users outside the project stay cached."""
+        keys = self._prime(self.member_user)
+
+        self.project.save()
+
+        for key in keys:
+            self.assertIsNotNone(cache.get(key))
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class ProjectStatsCacheSignalsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+        self.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        self.workspace = Workspace.objects.create(
+            organization=self.organization,
+            name='Test Workspace'
+        )
+        self.project = Project.objects.create(
+            workspace=self.workspace,
+            name='Test Project'
+        )
+        self.key = stats_cache_key(self.project.id)
+
+    def test_task_changes_invalidate_stats(self):
+        """Test creating and deleting a task drops cached project stats."""
+        cache.set(self.key, {'total_hours': '1.00'})
+        task = Task.objects.create(project=self.project, title='Test Task')
+        self.assertIsNone(cache.get(self.key))
+
+        cache.set(self.key, {'total_hours': '1.00'})
+        task.delete()
+        self.assertIsNone(cache.get(self.key))
+
+    def test_task_changes_invalidate_progress(self):
+        """Test saving a task drops the project's cached task counts."""
+        key = progress_cache_key(self.project.id)
+        task = Task.objects.create(project=self.project, title='Test Task')
+
+        cache.set(key, {'total': 1, 'completed': 0})
+        task.status = 'done'
+        task.save()
+        self.assertIsNone(cache.get(key))
+
+    def test_task_edit_keeps_progress(self):
+        """Test edits that leave the status alone keep cached task counts."""
+        key = progress_cache_key(self.project.id)
+        task = Task.objects.create(project=self.project, title='Test Task')
+
+        cache.set(key, {'total': 1, 'completed': 0})
+        cache.set(self.key, {'total_hours': '1.00'})
+        task = Task.objects.get(pk=task.pk)
+        task.title = 'Renamed Task'
+        task.save()
+        self.assertIsNotNone(cache.get(key))
+        self.assertIsNotNone(cache.get(self.key))
+
+    def test_task_move_invalidates_both_projects(self):
+        """Test moving a task drops cached counts of both projects."""
+        other_project = Project.objects.create(
+            workspace=self.workspace,
+            name='Other Project'
+        )
+        task = Task.objects.create(project=self.project, title='Test Task')
+        keys = [progress_cache_key(self.project.id), progress_cache_key(other_project.id)]
+        for key in keys:
+            cache.set(key, {'total': 1, 'completed': 0})
+
+        task = Task.objects.get(pk=task.pk)
+        task.project = other_project
+        task.save()
+
+        for key in keys:
+            self.assertIsNone(cache.get(key))
+
+    def test_bulk_status_change_invalidates_progress(self):
+        """Test bulk status updates drop the cached counts they bypass signals for."""
+        key = progress_cache_key(self.project.id)
+        Task.objects.create(project=self.project, title='First Task')
+        Task.objects.create(project=self.project, title='Second Task')
+
+        cache.set(key, {'total': 2, 'completed': 0})
+        updated = Task.objects.filter(project=self.project).set_status('done')
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(
+            Task.objects.filter(project=self.project, status='done').count(), 2
+        )
+        self.assertIsNone(cache.get(key))
+
+    def test_refresh_project_progress(self):
+        """Test bulk progress refresh caches large projects and drops small ones."""
+        small_project = Project.objects.create(
+            workspace=self.workspace,
+            name='Small Project'
+        )
+        Task.objects.bulk_create(
+            [Task(project=self.project, title=f'Task {i}', status='done') for i in range(4)] +
+            [Task(project=self.project, title=f'Open Task {i}') for i in range(12)] +
+            [Task(project=small_project, title='Small Task')]
+        )
+        small_key = progress_cache_key(small_project.id)
+        cache.set(small_key, {'total': 0, 'completed': 0})
+
+        with self.assertNumQueries(1):
+            refresh_project_progress([self.project.id, small_project.id])
+
+        self.assertEqual(
+            cache.get(progress_cache_key(self.project.id)),
+            {'total': 16, 'completed': 4}
+        )
+        self.assertIsNone(cache.get(small_key))
+
+    def test_project_save_invalidates_stats(self):
+        """Test saving a project drops its cached stats."""
+        cache.set(self.key, {'total_hours': '1.00'})
+        self.project.hourly_rate = 100
+        self.project.save()
+        self.assertIsNone(cache.get(self.key))
+
+    def test_project_cost_cached_until_project_changes(self):
+        """Test the serialized cost is cached and dropped when the project changes."""
+        from decimal import Decimal
+        from projects.serializers import ProjectSerializer
+        serializer = ProjectSerializer()
+        
+        self.assertEqual(serializer.get_total_cost(self.project), Decimal('0.00'))
+        with self.assertNumQueries(0):
+            serializer.get_total_cost(self.project)
+        
+        self.project.hourly_rate = 100
+        self.project.save()
+        self.assertIsNone(cache.get(cost_cache_key(self.project.id)))
+
+    def test_time_entry_move_invalidates_both_projects(self):
+        """Test moving a time entry drops cached stats and cost of both projects."""
+        from django.utils import timezone
+        from time_entries.models import TimeEntry
+        user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        other_project = Project.objects.create(
+            workspace=self.workspace,
+            name='Other Project'
+        )
+        entry = TimeEntry.objects.create(
+            user=user,
+            workspace=self.workspace,
+            project=self.project,
+            start_time=timezone.now(),
+            duration_minutes=60
+        )
+        keys = [
+            key(project_id)
+            for project_id in [self.project.id, other_project.id]
+            for key in [stats_cache_key, cost_cache_key]
+        ]
+        for key in keys:
+            cache.set(key, {'total_hours': '1.00'})
+
+        entry = TimeEntry.objects.get(pk=entry.pk)
+        entry.project = other_project
+        entry.save()
+
+        for key in keys:
+            self.assertIsNone(cache.get(key))
@@ -265,7 +265,7 @@ class ProjectViewSetTest(APITestCase):
         Task.objects.create(
             project=self.project,
             title='Task 1',
-            status='completed'
+            status='done'
         )
         Task.objects.create(
             project=self.project,
@@ -598,19 +598,21 @@ class ProjectReportViewSetTest(APITestCase):
     def test_project_summary_report_with_date_filter(self):
         """Test project summary report with date filtering."""
         # Set dates on projects
-        self.project1.start_date = date.today() - timedelta(days=10)
-        self.project1.end_date = date.today() + timedelta(days=20)
-        self.project1.save()
-
-        self.project2.start_date = date.today() - timedelta(days=5)
-        self.project2.end_date = date.today() + timedelta(days=15)
-        self.project2.save()
+        today = date.today()
+        Project.objects.filter(pk=self.project1.pk).update(
+            start_date=today - timedelta(days=10),
+            end_date=today + timedelta(days=20)
+        )
+        Project.objects.filter(pk=self.project2.pk).update(
+            start_date=today - timedelta(days=5),
+            end_date=today + timedelta(days=15)
+        )
 
         url = reverse('projects:projectreport-summary')
         params = {
             'workspace': str(self.workspace.id),
-            'start_date': (date.today() - timedelta(days=7)).isoformat(),
-            'end_date': (date.today() + timedelta(days=10)).isoformat()
+            'start_date': (today - timedelta(days=7)).isoformat(),
+            'end_date': (today + timedelta(days=10)).isoformat()
         }
 
         response = self.client.get(url, params)
@@ -620,6 +622,40 @@ class ProjectReportViewSetTest(APITestCase):
         summary = response.data['summary']
         self.assertEqual(summary['total_projects'], 2)
 
+    def test_project_summary_report_keeps_open_ended_projects(self):
+        """Test the date filter keeps open-ended and period-spanning projects."""
+        from rest_framework.test import APIRequestFactory, force_authenticate
+        from projects.views import ProjectReportViewSet
+        today = date.today()
+        # Ongoing, with no end date yet
+        Project.objects.filter(pk=self.project1.pk).update(
+            start_date=today - timedelta(days=3),
+            end_date=None
+        )
+        # Spans the whole period
+        Project.objects.filter(pk=self.project2.pk).update(
+            start_date=today - timedelta(days=30),
+            end_date=today + timedelta(days=30)
+        )
+        Project.objects.create(
+            name='Finished Project',
+            workspace=self.workspace,
+            start_date=today - timedelta(days=60),
+            end_date=today - timedelta(days=20)
+        )
+
+        # Called directly, as the project URLs are not mounted in main/urls.py
+        request = APIRequestFactory().get('/', {
+            'workspace': str(self.workspace.id),
+            'start_date': (today - timedelta(days=7)).isoformat(),
+            'end_date': (today + timedelta(days=10)).isoformat()
+        })
+        force_authenticate(request, user=self.user)
+        response = ProjectReportViewSet.as_view({'get': 'summary'})(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['summary']['total_projects'], 2)
+
     def test_project_summary_report_invalid_date(self):
         """Test project summary report with invalid date format."""
         url = reverse('projects:projectreport-summary')
@@ -0,0 +1,61 @@
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from organizations.models import Organization, Workspace
+from projects.models import Project
+from tasks.models import Task, TaskActivity, TaskComment
+
+User = get_user_model()
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class TasksAdminChangelistTest(TestCase):
+    def setUp(self):
+        self.superuser = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='admin123'
+        )
+        self.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        self.workspace = Workspace.objects.create(
+            organization=self.organization,
+            name='Test Workspace'
+        )
+        self.project = Project.objects.create(
+            workspace=self.workspace,
+            name='Test Project'
+        )
+        self.client.force_login(self.superuser)
+
+    def _changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def _add_rows(self, count):
+        tasks = Task.objects.bulk_create([
+            Task(project=self.project, title=f'Task {i}') for i in range(count)
+        ])
+        TaskComment.objects.bulk_create([
+            TaskComment(task=task, author=self.superuser, content='Note') for task in tasks
+        ])
+        TaskActivity.objects.log_many([
+            TaskActivity(task=task, user=self.superuser, action='created') for task in tasks
+        ])
+
+    def test_changelists_render_in_constant_queries(self):
+        """Test changelist rows don't query per row to render __str__."""
+        urls = ['/admin/tasks/taskcomment/', '/admin/tasks/taskactivity/']
+        self._add_rows(1)
+        baseline = [self._changelist_queries(url) for url in urls]
+
+        self._add_rows(4)
+
+        self.assertEqual([self._changelist_queries(url) for url in urls], baseline)
@@ -1,21 +1,23 @@
 import pytest
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.contrib.auth import get_user_model
 from tasks.models import TaskLabel, Task
+from tests.factories import make_scaffold
 
 User = get_user_model()
 
 
 class TaskLabelModelTest(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         # Create organization and workspace first (required for TaskLabel)
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace',
             slug='test-workspace'
         )
@@ -44,8 +46,9 @@ class TaskLabelModelTest(TestCase):
 
 
 class TaskModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -53,17 +56,17 @@ class TaskModelTest(TestCase):
         
         # Create organization and workspace first (required for Task)
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace',
             slug='test-workspace'
         )
         
-        self.project = None  # Project is optional for Task
+        cls.project = None  # Project is optional for Task
         
     def test_task_creation(self):
         task = Task.objects.create(
@@ -90,4 +93,184 @@ class TaskModelTest(TestCase):
             title='Test Task'
         )
         
-        self.assertEqual(str(task), 'Test Task')
\ No newline at end of file
+        self.assertEqual(str(task), 'Test Task')
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class TaskQuerySetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        scaffold = make_scaffold()
+        cls.user = scaffold.user
+        cls.organization = scaffold.organization
+        cls.workspace = scaffold.workspace
+        cls.project = scaffold.project
+
+    def test_open_excludes_finished_tasks(self):
+        """Test open() keeps only tasks still being worked on."""
+        Task.objects.bulk_create([
+            Task(project=self.project, title=f'{status} task', status=status)
+            for status in ['todo', 'in_progress', 'review', 'blocked', 'done', 'cancelled']
+        ])
+
+        statuses = set(Task.objects.open().values_list('status', flat=True))
+
+        self.assertEqual(statuses, {'todo', 'in_progress', 'review', 'blocked'})
+
+    def test_set_status_logs_activity_in_one_insert(self):
+        """Test bulk status changes write their activity rows together."""
+        from tasks.models import TaskActivity
+        Task.objects.bulk_create(
+            [Task(project=self.project, title=f'Task {i}') for i in range(3)] +
+            [Task(project=self.project, title='Done Task', status='done')]
+        )
+
+        # Read, UPDATE, activity INSERT and the progress recount
+        with self.assertNumQueries(4):
+            updated = Task.objects.filter(project=self.project).set_status('done')
+
+        self.assertEqual(updated, 4)
+        activities = TaskActivity.objects.filter(action='status_changed')
+        self.assertEqual(activities.count(), 3)
+        self.assertEqual(activities.first().old_value, {'status': 'todo'})
+
+    def test_task_path_tracks_hierarchy(self):
+        """Test ancestor paths follow re-parenting down the whole subtree."""
+        root = Task.objects.create(project=self.project, title='Root')
+        other_root = Task.objects.create(project=self.project, title='Other Root')
+        child = Task.objects.create(project=self.project, title='Child', parent_task=root)
+        grandchild = Task.objects.create(
+            project=self.project, title='Grandchild', parent_task=child
+        )
+
+        self.assertEqual(set(root.get_descendants()), {child, grandchild})
+        self.assertEqual(list(grandchild.get_ancestors()), [root, child])
+
+        child = Task.objects.get(pk=child.pk)
+        child.parent_task = other_root
+        child.save()
+
+        grandchild.refresh_from_db()
+        self.assertEqual(list(grandchild.get_ancestors()), [other_root, child])
+        self.assertEqual(list(root.get_descendants()), [])
+        self.assertEqual(set(other_root.get_descendants()), {child, grandchild})
+
+    def test_task_cannot_move_under_its_subtree(self):
+        """Test re-parenting a task under itself or a descendant is rejected."""
+        from django.core.exceptions import ValidationError
+        root = Task.objects.create(project=self.project, title='Root')
+        child = Task.objects.create(project=self.project, title='Child', parent_task=root)
+        grandchild = Task.objects.create(
+            project=self.project, title='Grandchild', parent_task=child
+        )
+
+        for parent in (grandchild, root):
+            root = Task.objects.get(pk=root.pk)
+            root.parent_task = parent
+            with self.assertRaises(ValidationError):
+                root.save()
+
+        self.assertEqual(Task.objects.get(pk=root.pk).path, '')
+        self.assertEqual(set(root.get_descendants()), {child, grandchild})
+
+    def test_label_names_follow_labels(self):
+        """Test label names are copied onto tasks as labels change."""
+        bug = TaskLabel.objects.create(workspace=self.workspace, name='bug')
+        api = TaskLabel.objects.create(workspace=self.workspace, name='api')
+        task = Task.objects.create(project=self.project, title='Test Task')
+        other = Task.objects.create(project=self.project, title='Other Task')
+
+        task.labels.add(bug, api)
+        self.assertEqual(task.label_names, ['api', 'bug'])
+        bug.tasks.add(other)
+        self.assertEqual(Task.objects.get(pk=other.pk).label_names, ['bug'])
+
+        bug.name = 'defect'
+        bug.save()
+        self.assertEqual(Task.objects.get(pk=task.pk).label_names, ['api', 'defect'])
+
+        bug.tasks.clear()
+        self.assertEqual(Task.objects.get(pk=other.pk).label_names, [])
+
+        api.delete()
+        self.assertEqual(Task.objects.get(pk=task.pk).label_names, [])
+
+    def test_label_edit_without_rename_skips_tasks(self):
+        """Test saving a label with an unchanged name leaves its tasks alone."""
+        bug = TaskLabel.objects.create(workspace=self.workspace, name='bug')
+        task = Task.objects.create(project=self.project, title='Test Task')
+        task.labels.add(bug)
+
+        bug = TaskLabel.objects.get(pk=bug.pk)
+        bug.color = '#ef4444'
+        # Only the label UPDATE
+        with self.assertNumQueries(1):
+            bug.save()
+
+        bug.name = 'defect'
+        bug.save()
+        self.assertEqual(Task.objects.get(pk=task.pk).label_names, ['defect'])
+
+
+class TaskLabelConstraintTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from organizations.models import Organization, Workspace
+        cls.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
+            name='Test Workspace'
+        )
+
+    def test_label_names_unique_ignoring_case(self):
+        """Test a workspace can't hold labels differing only in case."""
+        from django.db import IntegrityError
+        TaskLabel.objects.create(workspace=self.workspace, name='Bug')
+
+        with self.assertRaises(IntegrityError):
+            TaskLabel.objects.create(workspace=self.workspace, name='bug')
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class TaskLabelQuerySetTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        scaffold = make_scaffold()
+        cls.user = scaffold.user
+        cls.organization = scaffold.organization
+        cls.workspace = scaffold.workspace
+        cls.project = scaffold.project
+
+    def test_with_usage_count(self):
+        """Test labels are annotated with the number of tasks carrying them."""
+        bug = TaskLabel.objects.create(workspace=self.workspace, name='Bug')
+        TaskLabel.objects.create(workspace=self.workspace, name='Idea')
+        for i in range(2):
+            task = Task.objects.create(project=self.project, title=f'Task {i}')
+            task.labels.add(bug)
+
+        counts = dict(
+            TaskLabel.objects.with_usage_count().values_list('name', 'usage_count')
+        )
+
+        self.assertEqual(counts, {'Bug': 2, 'Idea': 0})
+
+
+class Uuid7Test(TestCase):
+    def test_ids_are_version_7_and_time_ordered(self):
+        """Test generated ids carry version 7 and sort by creation time."""
+        import time
+        from tasks.models import uuid7
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        self.assertEqual(first.version, 7)
+        self.assertLess(first, second)
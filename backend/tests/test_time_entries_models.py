@@ -8,8 +8,9 @@ User = get_user_model()
 
 
 class TimeEntryModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -17,20 +18,20 @@ class TimeEntryModelTest(TestCase):
         
         # Create organization and workspace first (required for TimeEntry)
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace',
             slug='test-workspace'
         )
         
         # Create project (required for TimeEntry)
         from projects.models import Project
-        self.project = Project.objects.create(
-            workspace=self.workspace,
+        cls.project = Project.objects.create(
+            workspace=cls.workspace,
             name='Test Project',
             slug='test-project'
         )
@@ -0,0 +1,144 @@
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from projects.models import Project
+from organizations.models import Organization, Workspace
+from time_entries.models import TimeEntry
+
+User = get_user_model()
+
+
+class ProjectActualMinutesSignalsTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+
+        self.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        self.workspace = Workspace.objects.create(
+            organization=self.organization,
+            name='Test Workspace'
+        )
+
+        self.project = Project.objects.create(
+            workspace=self.workspace,
+            name='Test Project'
+        )
+        self.other_project = Project.objects.create(
+            workspace=self.workspace,
+            name='Other Project'
+        )
+
+    def _entry(self, minutes):
+        return TimeEntry.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            project=self.project,
+            start_time=timezone.now(),
+            duration_minutes=minutes
+        )
+
+    def _minutes(self, project):
+        project.refresh_from_db(fields=['actual_minutes'])
+        return project.actual_minutes
+
+    def test_entry_changes_update_counter(self):
+        """Test creating, editing and deleting entries keeps the counter in step."""
+        entry = self._entry(90)
+        self._entry(30)
+        self.assertEqual(self._minutes(self.project), 120)
+
+        entry.duration_minutes = 60
+        entry.save()
+        entry.save()
+        self.assertEqual(self._minutes(self.project), 90)
+
+        entry = TimeEntry.objects.get(pk=entry.pk)
+        entry.delete()
+        self.assertEqual(self._minutes(self.project), 30)
+
+    def test_moving_entry_between_projects(self):
+        """Test moving a loaded entry shifts its minutes across projects."""
+        entry = TimeEntry.objects.get(pk=self._entry(45).pk)
+
+        entry.project = self.other_project
+        entry.save()
+
+        self.assertEqual(self._minutes(self.project), 0)
+        self.assertEqual(self._minutes(self.other_project), 45)
+
+    def test_deferred_entry_recounts(self):
+        """Test saving an entry loaded without its duration recounts the project."""
+        self._entry(20)
+        entry = TimeEntry.objects.only('id', 'project').get(pk=self._entry(40).pk)
+
+        entry.description = 'Updated'
+        entry.save()
+
+        self.assertEqual(self._minutes(self.project), 60)
+
+    def test_recount_actual_minutes(self):
+        """Test the counter can be rebuilt after bulk updates."""
+        self._entry(15)
+        TimeEntry.objects.filter(project=self.project).update(duration_minutes=25)
+
+        Project.objects.filter(pk=self.project.pk).recount_actual_minutes()
+
+        self.assertEqual(self._minutes(self.project), 25)
+
+    def test_counter_never_drops_below_zero(self):
+        """Test releasing minutes the counter never saw leaves it at zero."""
+        TimeEntry.objects.bulk_create([
+            TimeEntry(
+                user=self.user,
+                workspace=self.workspace,
+                project=self.project,
+                start_time=timezone.now(),
+                duration_minutes=50
+            )
+        ])
+        entry = TimeEntry.objects.get(project=self.project)
+
+        entry.delete()
+
+        self.assertEqual(self._minutes(self.project), 0)
+
+    def test_saving_stale_project_keeps_counter(self):
+        """Test saving a project loaded before entries were logged keeps the counter."""
+        stale = Project.objects.get(pk=self.project.pk)
+        self._entry(90)
+
+        stale.name = 'Renamed Project'
+        stale.save()
+
+        self.assertEqual(self._minutes(self.project), 90)
+        self.assertEqual(Project.objects.get(pk=self.project.pk).name, 'Renamed Project')
+
+    def test_saving_deferred_project_keeps_counter(self):
+        """Test saving a project loaded with only() keeps the counter and its deferred fields."""
+        partial = Project.objects.only('id', 'name').get(pk=self.project.pk)
+        self._entry(90)
+
+        partial.name = 'Renamed Project'
+        with self.assertNumQueries(4):
+            # The UPDATE, then the dashboard signal's member lookup and its
+            # reads of manager_id and workspace_id
+            partial.save()
+
+        self.assertEqual(self._minutes(self.project), 90)
+        self.assertEqual(Project.objects.get(pk=self.project.pk).name, 'Renamed Project')
+
+    def test_saving_named_counter_writes_it(self):
+        """Test naming actual_minutes in update_fields writes the held value."""
+        self._entry(90)
+        project = Project.objects.get(pk=self.project.pk)
+        project.actual_minutes = 45
+
+        project.save(update_fields=['actual_minutes'])
+
+        self.assertEqual(self._minutes(self.project), 45)
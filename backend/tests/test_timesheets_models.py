@@ -1,15 +1,19 @@
 import pytest
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 from django.utils import timezone
-from timesheets.models import Timesheet, TimesheetEntry
+from timesheets.models import Timesheet, TimesheetEntry, TimesheetTemplate
+from timesheets.cache import templates_cache_key
+from tests.mixins import TimeMixin
 
 User = get_user_model()
 
 
 class TimesheetModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -17,12 +21,12 @@ class TimesheetModelTest(TestCase):
         
         # Create organization and workspace first (required for Timesheet)
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace',
             slug='test-workspace'
         )
@@ -65,8 +69,9 @@ class TimesheetModelTest(TestCase):
 
 
 class TimesheetEntryModelTest(TestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
@@ -74,27 +79,28 @@ class TimesheetEntryModelTest(TestCase):
         
         # Create organization and workspace first (required for Timesheet)
         from organizations.models import Organization, Workspace
-        self.organization = Organization.objects.create(
+        cls.organization = Organization.objects.create(
             name='Test Organization',
             slug='test-org'
         )
-        self.workspace = Workspace.objects.create(
-            organization=self.organization,
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
             name='Test Workspace',
             slug='test-workspace'
         )
         
-        self.timesheet = Timesheet.objects.create(
-            user=self.user,
-            workspace=self.workspace,
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date() + timezone.timedelta(days=6)
+        today = timezone.localdate()
+        cls.timesheet = Timesheet.objects.create(
+            user=cls.user,
+            workspace=cls.workspace,
+            start_date=today,
+            end_date=today + timezone.timedelta(days=6)
         )
         
         # Create project (required for TimesheetEntry)
         from projects.models import Project
-        self.project = Project.objects.create(
-            workspace=self.workspace,
+        cls.project = Project.objects.create(
+            workspace=cls.workspace,
             name='Test Project',
             slug='test-project'
         )
@@ -125,4 +131,146 @@ class TimesheetEntryModelTest(TestCase):
         )
         
         expected_str = f"Timesheet Entry for {entry.day}: {entry.hours} hours"
-        self.assertEqual(str(entry), expected_str)
\ No newline at end of file
+        self.assertEqual(str(entry), expected_str)
+
+
+class TimesheetQuerySetTest(TimeMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from organizations.models import Organization, Workspace
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        cls.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
+            name='Test Workspace'
+        )
+
+    def _timesheet(self, weeks_ago, status):
+        end_date = self.now.date() - timezone.timedelta(days=7 * weeks_ago)
+        return Timesheet.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            start_date=end_date - timezone.timedelta(days=6),
+            end_date=end_date,
+            status=status
+        )
+
+    def test_with_overdue(self):
+        """Test only unsubmitted timesheets past the deadline are flagged."""
+        overdue = self._timesheet(2, 'draft')
+        self._timesheet(3, 'approved')
+        self._timesheet(0, 'draft')
+
+        flagged = Timesheet.objects.with_overdue().filter(is_overdue=True)
+
+        self.assertEqual(list(flagged), [overdue])
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class TimesheetTemplateModelTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from organizations.models import Organization, Workspace
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        cls.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
+            name='Test Workspace'
+        )
+        cls.template = TimesheetTemplate.objects.create(
+            user=cls.user,
+            workspace=cls.workspace,
+            name='Standard Week'
+        )
+
+    def test_mark_used_increments_atomically(self):
+        """Test marking a template used bumps the counter without a read."""
+        stale = TimesheetTemplate.objects.get(pk=self.template.pk)
+
+        with self.assertNumQueries(1):
+            self.template.mark_used()
+        stale.mark_used()
+
+        self.template.refresh_from_db()
+        self.assertEqual(self.template.use_count, 2)
+        self.assertIsNotNone(self.template.last_used)
+
+    def test_bulk_mark_used(self):
+        """Test marking several templates used takes one UPDATE plus the owner lookup."""
+        other = TimesheetTemplate.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            name='Short Week'
+        )
+
+        with self.assertNumQueries(2):
+            updated = TimesheetTemplate.objects.filter(
+                pk__in=[self.template.pk, other.pk]
+            ).mark_used()
+
+        self.assertEqual(updated, 2)
+        self.assertEqual(
+            list(TimesheetTemplate.objects.values_list('use_count', flat=True)), [1, 1]
+        )
+
+
+@override_settings(CACHES={
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+})
+class TimesheetTemplateCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        from organizations.models import Organization, Workspace
+        cls.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        cls.organization = Organization.objects.create(
+            name='Test Organization',
+            slug='test-org'
+        )
+        cls.workspace = Workspace.objects.create(
+            organization=cls.organization,
+            name='Test Workspace'
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_template_changes_invalidate_cached_list(self):
+        """Test creating, using and deleting a template drops cached lists."""
+        key = templates_cache_key(self.user.id)
+        cache.set(key, {'results': []})
+        template = TimesheetTemplate.objects.create(
+            user=self.user,
+            workspace=self.workspace,
+            name='Standard Week'
+        )
+        self.assertIsNone(cache.get(templates_cache_key(self.user.id)))
+
+        key = templates_cache_key(self.user.id)
+        cache.set(key, {'results': []})
+        template.mark_used()
+        self.assertIsNone(cache.get(templates_cache_key(self.user.id)))
+
+        key = templates_cache_key(self.user.id)
+        cache.set(key, {'results': []})
+        template.delete()
+        self.assertIsNone(cache.get(templates_cache_key(self.user.id)))
@@ -0,0 +1,90 @@
+from decimal import Decimal
+from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+from timesheets.models import (
+    Timesheet, TimesheetApproval, TimesheetEntry, TimesheetException
+)
+from timesheets.views import TimesheetViewSet
+from tests.factories import make_scaffold
+
+User = get_user_model()
+
+
+class TimesheetListIncludeTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        scaffold = make_scaffold()
+        cls.user = scaffold.user
+        # Superusers list every timesheet, keeping the approver filter out
+        # of the queries counted below
+        User.objects.filter(pk=cls.user.pk).update(is_superuser=True)
+        cls.user.is_superuser = True
+        cls.workspace = scaffold.workspace
+        cls.project = scaffold.project
+
+        today = timezone.localdate()
+        for week in range(2):
+            start_date = today + timezone.timedelta(days=7 * week)
+            timesheet = Timesheet.objects.create(
+                user=cls.user,
+                workspace=cls.workspace,
+                start_date=start_date,
+                end_date=start_date + timezone.timedelta(days=6)
+            )
+            TimesheetEntry.objects.bulk_create([
+                TimesheetEntry(
+                    timesheet=timesheet,
+                    date=start_date + timezone.timedelta(days=day),
+                    project=cls.project,
+                    hours=Decimal('2.00')
+                )
+                for day in range(2)
+            ])
+            TimesheetApproval.objects.create(timesheet=timesheet, approver=cls.user)
+            TimesheetException.objects.create(
+                timesheet=timesheet,
+                exception_type='overtime',
+                title='Long day'
+            )
+
+    def _list(self, **params):
+        request = APIRequestFactory().get('/timesheets/', params)
+        force_authenticate(request, user=self.user)
+        response = TimesheetViewSet.as_view({'get': 'list'})(request)
+        self.assertEqual(response.status_code, 200)
+        return response.data['results']
+
+    def test_list_renders_all_nested_lists_by_default(self):
+        """Test a list without ?include= renders every nested list."""
+        # Count, timesheets, then one prefetch per nested list
+        with self.assertNumQueries(5):
+            results = self._list()
+
+        self.assertEqual(len(results), 2)
+        for item in results:
+            self.assertEqual(len(item['entries']), 2)
+            self.assertEqual(item['entries'][0]['project_name'], 'Test Project')
+            self.assertEqual(len(item['approvals']), 1)
+            self.assertEqual(len(item['exceptions']), 1)
+
+    def test_list_renders_only_included_lists(self):
+        """Test ?include=entries renders and prefetches only the entries."""
+        with self.assertNumQueries(3):
+            results = self._list(include='entries')
+
+        for item in results:
+            self.assertEqual(len(item['entries']), 2)
+            self.assertNotIn('approvals', item)
+            self.assertNotIn('exceptions', item)
+
+    def test_list_with_empty_include_drops_nested_lists(self):
+        """Test an empty ?include= leaves out every nested list."""
+        with self.assertNumQueries(2):
+            results = self._list(include='')
+
+        for item in results:
+            for name in TimesheetViewSet.serializer_class.NESTED_LISTS:
+                self.assertNotIn(name, item)
+            self.assertEqual(item['workspace_name'], 'Test Workspace')
@@ -22,10 +22,11 @@ class TimesheetViewTest(TestCase):
         self.client.force_authenticate(user=self.user)
         
         # Create test data
+        today = timezone.localdate()
         self.timesheet = Timesheet.objects.create(
             user=self.user,
-            start_date=timezone.now().date(),
-            end_date=timezone.now().date() + timezone.timedelta(days=6),
+            start_date=today,
+            end_date=today + timezone.timedelta(days=6),
             status='draft'
         )
         
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TimeEntriesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "time_entries"
+
+    def ready(self):
+        """App ready signal handler."""
+        import time_entries.signals  # Import signal handlers
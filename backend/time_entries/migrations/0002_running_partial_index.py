@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("time_entries", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="timeentry",
+            name="time_entrie_is_runn_a70bc6_idx",
+        ),
+        migrations.AddIndex(
+            model_name="timeentry",
+            index=models.Index(
+                condition=models.Q(("is_running", True)),
+                fields=["user"],
+                name="time_entry_running_idx",
+            ),
+        ),
+    ]
@@ -101,9 +101,23 @@ class TimeEntry(models.Model):
             models.Index(fields=['user', 'start_time']),
             models.Index(fields=['project', 'start_time']),
             models.Index(fields=['workspace', 'start_time']),
-            models.Index(fields=['is_running']),
+            # Only a handful of entries are running at once; index just those
+            models.Index(
+                fields=['user'],
+                condition=models.Q(is_running=True),
+                name='time_entry_running_idx'
+            ),
         ]
         
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what this entry contributes to Project.actual_minutes so
+        # the signal handlers can apply the difference; unknown if deferred
+        if 'project_id' in instance.__dict__ and 'duration_minutes' in instance.__dict__:
+            instance._counted_minutes = (instance.project_id, instance.duration_minutes or 0)
+        return instance
+        
     def save(self, *args, **kwargs):
         # Calculate duration if both start and end times are set
         if self.start_time and self.end_time and not self.is_running:
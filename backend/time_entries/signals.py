@@ -0,0 +1,72 @@
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from projects.cache import invalidate_project_stats
+from projects.models import Project
+from .models import TimeEntry
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def add_project_minutes(project_id, minutes):
+    """
+    Shift a project's actual_minutes counter in place.
+    
+    Decrements are clamped at zero inside the UPDATE, so minutes the counter
+    never saw (e.g. bulk-created entries) can't trip its >= 0 CHECK.
+    """
+    if project_id is not None and minutes:
+        actual_minutes = F('actual_minutes') + minutes
+        if minutes < 0:
+            actual_minutes = Greatest(actual_minutes, 0)
+        Project.objects.filter(pk=project_id).update(actual_minutes=actual_minutes)
+
+
+@receiver(post_save, sender=TimeEntry)
+def update_project_minutes(sender, instance, created, **kwargs):
+    """Apply a saved entry's change in tracked minutes to its project."""
+    minutes = instance.duration_minutes or 0
+    counted = (None, 0) if created else getattr(instance, '_counted_minutes', None)
+    
+    if counted is None:
+        # What was counted before is unknown, so recount from the entries
+        Project.objects.filter(pk=instance.project_id).recount_actual_minutes()
+    else:
+        counted_project_id, counted_minutes = counted
+        if counted_project_id == instance.project_id:
+            add_project_minutes(instance.project_id, minutes - counted_minutes)
+        else:
+            add_project_minutes(counted_project_id, -counted_minutes)
+            add_project_minutes(instance.project_id, minutes)
+            # The entry left its old project, whose cached totals still count it
+            invalidate_cached_stats(counted_project_id)
+    
+    instance._counted_minutes = (instance.project_id, minutes)
+
+
+@receiver(post_delete, sender=TimeEntry)
+def release_project_minutes(sender, instance, **kwargs):
+    """Take a deleted entry's tracked minutes off its project."""
+    counted = getattr(instance, '_counted_minutes', None)
+    if counted is None:
+        counted = (instance.project_id, instance.duration_minutes or 0)
+    
+    add_project_minutes(counted[0], -counted[1])
+
+
+def invalidate_cached_stats(project_id):
+    """Drop a project's cached statistics, logging rather than raising on cache errors."""
+    try:
+        invalidate_project_stats(project_id)
+
+    except Exception as e:
+        logger.error(f"Error invalidating project stats for time entry: {e}")
+
+
+@receiver(post_save, sender=TimeEntry)
+@receiver(post_delete, sender=TimeEntry)
+def handle_time_entry_change(sender, instance, **kwargs):
+    """Invalidate cached project statistics when tracked time changes."""
+    invalidate_cached_stats(instance.project_id)
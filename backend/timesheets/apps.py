@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TimesheetsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "timesheets"
+
+    def ready(self):
+        """App ready signal handler."""
+        import timesheets.signals  # Import signal handlers
@@ -0,0 +1,33 @@
+import uuid
+
+from django.core.cache import cache
+
+
+# Template lists change only when a template is edited or applied
+TEMPLATES_CACHE_TTL = 300
+
+
+def templates_version_key(user_id):
+    """Build the cache key holding the current version of a user's template lists."""
+    return f"timesheets:templates:{user_id}:version"
+
+
+def templates_cache_key(user_id, page=None):
+    """
+    Build the cache key for one page of a user's template list.
+    
+    Pages are keyed under a per-user version, so bumping the version drops
+    every cached page at once without knowing which pages were stored.
+    """
+    version = cache.get(templates_version_key(user_id))
+    if version is None:
+        version = uuid.uuid4().hex
+        cache.set(templates_version_key(user_id), version, None)
+    return f"timesheets:templates:{user_id}:{version}:{page or 1}"
+
+
+def invalidate_templates(user_ids):
+    """Drop the cached template lists of the given users."""
+    for user_id in user_ids:
+        if user_id is not None:
+            cache.set(templates_version_key(user_id), uuid.uuid4().hex, None)
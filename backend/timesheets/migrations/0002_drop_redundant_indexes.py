@@ -0,0 +1,16 @@
+# Generated by Django 4.2.7 on 2026-10-16 19:17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timesheets", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="timesheet",
+            name="timesheets_user_id_54c22f_idx",
+        ),
+    ]
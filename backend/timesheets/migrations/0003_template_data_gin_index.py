@@ -0,0 +1,31 @@
+# GIN index backing containment lookups on timesheet template data.
+
+from django.db import migrations
+
+
+def create_gin_index(apps, schema_editor):
+    """Index template_data for `contains` filters; jsonb_path_ops keeps it small."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS timesheet_template_data_gin "
+        "ON timesheet_templates USING gin (template_data jsonb_path_ops)"
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    schema_editor.execute("DROP INDEX IF EXISTS timesheet_template_data_gin")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("timesheets", "0002_drop_redundant_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_index, drop_gin_index),
+    ]
@@ -1,16 +1,49 @@
 from django.db import models
+from django.db.models import Case, F, Value, When
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
 import uuid
 from datetime import datetime, timedelta
 
+from .cache import invalidate_templates
+
 
 def default_dict():
     """Default empty dictionary"""
     return {}
 
 
+# Days after a period ends before its unsubmitted timesheet is overdue
+SUBMISSION_GRACE_DAYS = 3
+
+
+class TimesheetQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for timesheet listings.
+    """
+    
+    def with_overdue(self):
+        """
+        Annotate is_overdue: not yet submitted past the submission deadline.
+        
+        Evaluated by the database, so it can be filtered on and saves a date
+        comparison per serialized timesheet.
+        """
+        cutoff = timezone.now().date() - timedelta(days=SUBMISSION_GRACE_DAYS)
+        return self.annotate(
+            is_overdue=Case(
+                When(
+                    status__in=['draft', 'rejected'],
+                    end_date__lt=cutoff,
+                    then=Value(True)
+                ),
+                default=Value(False),
+                output_field=models.BooleanField()
+            )
+        )
+
+
 class Timesheet(models.Model):
     """
     Weekly/bi-weekly timesheet aggregation.
@@ -105,11 +138,12 @@ class Timesheet(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TimesheetQuerySet.as_manager()
+    
     class Meta:
         db_table = 'timesheets'
         unique_together = ['user', 'start_date', 'end_date']
         indexes = [
-            models.Index(fields=['user', 'start_date']),
             models.Index(fields=['workspace', 'status']),
             models.Index(fields=['status', 'submitted_at']),
         ]
@@ -311,6 +345,34 @@ class TimesheetException(models.Model):
         return f"{self.timesheet} - {self.exception_type} ({self.severity})"
 
 
+class TimesheetTemplateQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for template usage tracking.
+    """
+    
+    def mark_used(self):
+        """
+        Record a use of every template in the queryset with one UPDATE.
+        
+        The counter is bumped in the database, so concurrent applies never
+        lose a count, and applying several templates at once costs a single
+        round trip. Skips save(), so the owners' cached template lists are
+        invalidated here. Returns the number of templates updated.
+        """
+        user_ids = set(self.order_by().values_list('user_id', flat=True).distinct())
+        updated = self._bump_usage(timezone.now())
+        invalidate_templates(user_ids)
+        
+        return updated
+    
+    def _bump_usage(self, now):
+        return self.update(
+            use_count=F('use_count') + 1,
+            last_used=now,
+            updated_at=now
+        )
+
+
 class TimesheetTemplate(models.Model):
     """
     Templates for recurring timesheet patterns.
@@ -341,12 +403,22 @@ class TimesheetTemplate(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = TimesheetTemplateQuerySet.as_manager()
+    
     class Meta:
         db_table = 'timesheet_templates'
         unique_together = ['user', 'name']
         
     def __str__(self):
         return f"{self.user.email} - {self.name}"
+    
+    def mark_used(self):
+        """Record a use of this template; see TimesheetTemplateQuerySet.mark_used."""
+        now = timezone.now()
+        TimesheetTemplate.objects.filter(pk=self.pk)._bump_usage(now)
+        invalidate_templates([self.user_id])
+        self.last_used = now
+        self.updated_at = now
 
 
 class TimesheetReminder(models.Model):
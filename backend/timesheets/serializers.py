@@ -1,9 +1,12 @@
 from rest_framework import serializers
+from django.db.models import Prefetch
 from django.utils import timezone
+from django.utils.functional import cached_property
 from decimal import Decimal
 from .models import (
     Timesheet, TimesheetEntry, TimesheetApproval, 
-    TimesheetException, TimesheetTemplate, TimesheetReminder
+    TimesheetException, TimesheetTemplate, TimesheetReminder,
+    SUBMISSION_GRACE_DAYS
 )
 from time_entries.models import TimeEntry
 from projects.models import Project
@@ -122,21 +125,74 @@ class TimesheetSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
     
+    # Nested lists that can be left out of a response
+    NESTED_LISTS = ('entries', 'approvals', 'exceptions')
+    
+    def __init__(self, *args, include=None, **kwargs):
+        """
+        Optionally render only some nested lists.
+        
+        `include` names the nested lists to keep; None keeps them all.
+        """
+        super().__init__(*args, **kwargs)
+        if include is not None:
+            for field_name in set(self.NESTED_LISTS) - set(include):
+                self.fields.pop(field_name)
+    
+    @staticmethod
+    def setup_eager_loading(queryset, include=None):
+        """
+        Join the owner and prefetch the nested lists with the rows they name.
+        
+        The nested managers are unfiltered, so each field's .all() is served
+        from these prefetches rather than a query per timesheet. `include`
+        limits the prefetches to the nested lists being rendered.
+        """
+        prefetches = {
+            'entries': Prefetch(
+                'entries',
+                queryset=TimesheetEntry.objects.select_related('project', 'task')
+            ),
+            'approvals': Prefetch(
+                'approvals',
+                queryset=TimesheetApproval.objects.select_related('approver')
+            ),
+            'exceptions': Prefetch(
+                'exceptions',
+                queryset=TimesheetException.objects.select_related('resolved_by')
+            )
+        }
+        if include is not None:
+            prefetches = {name: prefetches[name] for name in include}
+        
+        return queryset.select_related('user', 'workspace').prefetch_related(
+            *prefetches.values()
+        )
+    
     def get_days_in_period(self, obj):
         """Calculate number of days in the timesheet period."""
         return (obj.end_date - obj.start_date).days + 1
     
     def get_submission_deadline(self, obj):
         """Calculate submission deadline (end of period + 3 days)."""
-        deadline = obj.end_date + timezone.timedelta(days=3)
+        deadline = obj.end_date + timezone.timedelta(days=SUBMISSION_GRACE_DAYS)
         return deadline
     
+    @cached_property
+    def today(self):
+        """Current date, resolved once per serializer instance."""
+        return timezone.now().date()
+    
     def get_is_overdue(self, obj):
         """Check if timesheet is overdue for submission."""
+        annotated = getattr(obj, 'is_overdue', None)
+        if annotated is not None:
+            return annotated
+        
         if obj.status in ['submitted', 'approved', 'locked']:
             return False
         deadline = self.get_submission_deadline(obj)
-        return timezone.now().date() > deadline
+        return self.today > deadline
     
     def get_can_submit(self, obj):
         """Check if current user can submit this timesheet."""
@@ -146,7 +202,7 @@ class TimesheetSerializer(serializers.ModelSerializer):
         
         return (
             obj.status == 'draft' and 
-            obj.user == request.user and
+            obj.user_id == request.user.id and
             obj.total_hours > 0
         )
     
@@ -160,7 +216,7 @@ class TimesheetSerializer(serializers.ModelSerializer):
         # This would be implemented based on your permission system
         return (
             obj.status == 'submitted' and
-            obj.user != request.user
+            obj.user_id != request.user.id
         )
     
     def validate(self, data):
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import TimesheetTemplate
+from .cache import invalidate_templates
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=TimesheetTemplate)
+@receiver(post_delete, sender=TimesheetTemplate)
+def handle_template_change(sender, instance, **kwargs):
+    """Invalidate the owner's cached template list when a template changes."""
+    try:
+        invalidate_templates([instance.user_id])
+
+    except Exception as e:
+        logger.error(f"Error invalidating timesheet template cache: {e}")
@@ -2,6 +2,8 @@ from rest_framework import viewsets, status, permissions, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.utils import timezone
+from django.utils.functional import cached_property
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models import Q, Sum, Count
 from decimal import Decimal
@@ -11,6 +13,7 @@ from .models import (
     Timesheet, TimesheetEntry, TimesheetApproval,
     TimesheetException, TimesheetTemplate
 )
+from .cache import TEMPLATES_CACHE_TTL, templates_cache_key
 from .serializers import (
     TimesheetSerializer, TimesheetEntrySerializer, TimesheetApprovalSerializer,
     TimesheetSubmissionSerializer, TimesheetApprovalActionSerializer,
@@ -29,16 +32,41 @@ class TimesheetViewSet(viewsets.ModelViewSet):
     serializer_class = TimesheetSerializer
     permission_classes = [permissions.IsAuthenticated]
     
+    @cached_property
+    def included_lists(self):
+        """
+        Nested lists a list response renders, from ?include=entries,approvals.
+        
+        Without the parameter every nested list is rendered, as the frontend
+        expects; clients opt into a narrower list with ?include= (an empty
+        value drops them all). Other actions always render them all.
+        """
+        if self.action != 'list' or 'include' not in self.request.query_params:
+            return None
+        include = self.request.query_params.get('include', '').split(',')
+        return [name for name in TimesheetSerializer.NESTED_LISTS if name in include]
+    
+    def get_serializer(self, *args, **kwargs):
+        """Render only the requested nested lists on list responses."""
+        if self.included_lists is not None:
+            kwargs['include'] = self.included_lists
+        return super().get_serializer(*args, **kwargs)
+    
     def get_queryset(self):
         """Filter timesheets based on user permissions."""
         user = self.request.user
-        queryset = Timesheet.objects.select_related(
-            'user', 'workspace', 'submitted_by', 'approved_by'
-        ).prefetch_related(
-            'entries__project', 'entries__task',
-            'approvals__approver', 'exceptions'
+        queryset = TimesheetSerializer.setup_eager_loading(
+            Timesheet.objects.all(), include=self.included_lists
         )
         
+        if self.action in ('list', 'retrieve'):
+            # Updates change status, so only reads use the flag
+            queryset = queryset.with_overdue()
+            
+            # Filter overdue timesheets in the database
+            if self.request.query_params.get('overdue') in ('true', '1'):
+                queryset = queryset.filter(is_overdue=True)
+        
         # Filter based on user role and permissions
         if user.is_superuser:
             return queryset
@@ -104,7 +132,7 @@ class TimesheetViewSet(viewsets.ModelViewSet):
         timesheet = self.get_object()
         
         # Check permissions
-        if timesheet.user != request.user:
+        if timesheet.user_id != request.user.id:
             return Response(
                 {'error': 'You can only submit your own timesheets'},
                 status=status.HTTP_403_FORBIDDEN
@@ -141,7 +169,7 @@ class TimesheetViewSet(viewsets.ModelViewSet):
         timesheet = self.get_object()
         
         # Check permissions - user should be able to approve others' timesheets
-        if timesheet.user == request.user:
+        if timesheet.user_id == request.user.id:
             return Response(
                 {'error': 'You cannot approve your own timesheet'},
                 status=status.HTTP_403_FORBIDDEN
@@ -201,7 +229,7 @@ class TimesheetViewSet(viewsets.ModelViewSet):
         """Generate timesheet entries from time tracking entries."""
         timesheet = self.get_object()
         
-        if timesheet.user != request.user:
+        if timesheet.user_id != request.user.id:
             return Response(
                 {'error': 'You can only generate entries for your own timesheets'},
                 status=status.HTTP_403_FORBIDDEN
@@ -226,11 +254,9 @@ class TimesheetViewSet(viewsets.ModelViewSet):
         user = request.user
         
         # Get timesheets that need approval from this user
-        pending_timesheets = Timesheet.objects.filter(
-            status='submitted'
-        ).exclude(user=user).select_related(
-            'user', 'workspace'
-        ).prefetch_related('entries')
+        pending_timesheets = TimesheetSerializer.setup_eager_loading(
+            Timesheet.objects.filter(status='submitted').exclude(user=user)
+        )
         
         # Filter by workspace permissions (simplified - in real app use proper permissions)
         workspace_id = request.query_params.get('workspace')
@@ -357,10 +383,14 @@ class TimesheetViewSet(viewsets.ModelViewSet):
         # Calculate overtime (simplified - over 40 hours per week)
         overtime_hours = max(Decimal('0.00'), total_hours - Decimal('40.00'))
         
+        totals = (total_hours, billable_hours, overtime_hours)
+        if totals == (timesheet.total_hours, timesheet.billable_hours, timesheet.overtime_hours):
+            return
+        
         timesheet.total_hours = total_hours
         timesheet.billable_hours = billable_hours
         timesheet.overtime_hours = overtime_hours
-        timesheet.save()
+        timesheet.save(update_fields=['total_hours', 'billable_hours', 'overtime_hours', 'updated_at'])
     
     def _create_approval_records(self, timesheet):
         """Create approval records for managers/supervisors."""
@@ -418,10 +448,14 @@ class TimesheetEntryViewSet(viewsets.ModelViewSet):
         billable_hours = sum(entry.hours for entry in entries if entry.is_billable)
         overtime_hours = max(Decimal('0.00'), total_hours - Decimal('40.00'))
         
+        totals = (total_hours, billable_hours, overtime_hours)
+        if totals == (timesheet.total_hours, timesheet.billable_hours, timesheet.overtime_hours):
+            return
+        
         timesheet.total_hours = total_hours
         timesheet.billable_hours = billable_hours
         timesheet.overtime_hours = overtime_hours
-        timesheet.save()
+        timesheet.save(update_fields=['total_hours', 'billable_hours', 'overtime_hours', 'updated_at'])
 
 
 class TimesheetTemplateViewSet(viewsets.ModelViewSet):
@@ -437,6 +471,15 @@ class TimesheetTemplateViewSet(viewsets.ModelViewSet):
             user=self.request.user
         ).order_by('-last_used', 'name')
     
+    def list(self, request, *args, **kwargs):
+        """List the user's templates, served from cache between changes."""
+        cache_key = templates_cache_key(request.user.id, request.query_params.get('page'))
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, TEMPLATES_CACHE_TTL)
+        return Response(data)
+    
     def perform_create(self, serializer):
         """Set user when creating template."""
         serializer.save(user=self.request.user)
@@ -463,9 +506,7 @@ class TimesheetTemplateViewSet(viewsets.ModelViewSet):
         
         # Apply template logic here
         # This would implement the template application based on template_data
-        template.use_count += 1
-        template.last_used = timezone.now()
-        template.save()
+        template.mark_used()
         
         return Response({'message': 'Template applied successfully'})
 
@@ -512,19 +553,23 @@ class TimesheetReportViewSet(viewsets.ReadOnlyModelViewSet):
         # Get timesheets in period
         timesheets = Timesheet.objects.filter(**filter_kwargs)
         
-        # Calculate summary statistics
+        status_keys = [status_choice[0] for status_choice in Timesheet.STATUS_CHOICES]
+        
+        # Calculate summary statistics and the status breakdown in one aggregate
         summary = timesheets.aggregate(
             total_timesheets=Count('id'),
             total_hours=Sum('total_hours'),
             total_billable_hours=Sum('billable_hours'),
-            total_overtime_hours=Sum('overtime_hours')
+            total_overtime_hours=Sum('overtime_hours'),
+            **{
+                f'status_{status_key}': Count('id', filter=Q(status=status_key))
+                for status_key in status_keys
+            }
         )
         
-        # Status breakdown
-        status_breakdown = {}
-        for status_choice in Timesheet.STATUS_CHOICES:
-            status_key = status_choice[0]
-            status_breakdown[status_key] = timesheets.filter(status=status_key).count()
+        status_breakdown = {
+            status_key: summary.pop(f'status_{status_key}') for status_key in status_keys
+        }
         
         return Response({
             'period': {